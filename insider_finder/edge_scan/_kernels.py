@@ -0,0 +1,177 @@
+"""
+Compiled numeric kernels for feature engineering and scoring.
+
+Numba is an optional dependency. When it is not installed, HAS_NUMBA is False
+and callers should use the NumPy implementations in features.py and
+scoring.py instead.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - optional dependency
+    njit = None
+
+HAS_NUMBA = njit is not None
+
+# Compiled eagerly at import (and cached to disk) so the first wallet isn't penalized
+_SIGNATURE = "UniTuple(float64, 3)(float64[:], float64[:], float64[:], float64, float64, float64, int64)"
+_SCORES_SIGNATURE = "float64[:](float64[:, :], float64[:], float64, float64)"
+_HOLDER_SIGNAL_SIGNATURE = "UniTuple(float64, 2)(float64[:], float64[:], float64[:], float64)"
+
+
+def _numeric_features(
+    pnl: np.ndarray,
+    risked: np.ndarray,
+    won: np.ndarray,
+    current_stake: float,
+    clip_pct: float,
+    prior: float,
+    min_sample: int,
+) -> tuple[float, float, float]:
+    """
+    Compute win rate, PnL per USD and conviction Z in a single fused kernel.
+
+    Mirrors _compute_win_rate, _compute_pnl_per_usd and _compute_conviction_z
+    in features.py.
+
+    Args:
+        pnl: Realized PnL per position
+        risked: Absolute amount risked per position
+        won: 1.0 for winning positions, else 0.0
+        current_stake: Current stake in target market (USD)
+        clip_pct: Winsorization percentile
+        prior: Shrinkage prior for win rate
+        min_sample: Effective sample size of the prior
+
+    Returns:
+        Tuple of (win_rate, pnl_per_usd, conviction_z), each in [0, 1]
+    """
+    n = pnl.shape[0]
+
+    # Single pass: stake totals for win rate, nonzero stakes for ratios and Z
+    # (Welford's running mean/variance, so no second pass over the stakes)
+    total_risked = 0.0
+    won_risked = 0.0
+    m = 0
+    mean_stake = 0.0
+    m2_stake = 0.0
+    ratios = np.empty(n, dtype=np.float64)
+    for i in range(n):
+        total_risked += risked[i]
+        won_risked += won[i] * risked[i]
+        if risked[i] > 0.0:
+            ratios[m] = pnl[i] / risked[i]
+            m += 1
+            delta = risked[i] - mean_stake
+            mean_stake += delta / m
+            m2_stake += delta * (risked[i] - mean_stake)
+
+    # Win rate with shrinkage
+    if n == 0 or total_risked == 0.0:
+        win_rate = prior
+    else:
+        observed = won_risked / total_risked
+        weight_obs = n / (n + min_sample)
+        weight_prior = min_sample / (n + min_sample)
+        win_rate = min(max(weight_obs * observed + weight_prior * prior, 0.0), 1.0)
+
+    if m == 0:
+        return win_rate, 0.5, 0.5
+
+    # PnL per USD: winsorized median from three order statistics (no full sort)
+    lower_idx = int(m * (1 - clip_pct) / 2)
+    upper_idx = int(m * (1 + clip_pct) / 2)
+    lower_idx = lower_idx if lower_idx < m else 0
+    upper_idx = upper_idx if upper_idx < m else m - 1
+    part = np.partition(ratios[:m], np.array([lower_idx, m // 2, upper_idx]))
+    median_pnl = min(max(part[m // 2], part[lower_idx]), part[upper_idx])
+    pnl_per_usd = min(max((median_pnl + 0.5) / 2.0, 0.0), 1.0)
+
+    # Conviction Z over nonzero stakes
+    std_stake = math.sqrt(max(m2_stake / m, 0.0))
+
+    if std_stake == 0.0:
+        conviction_z = 0.5
+    else:
+        z = (current_stake - mean_stake) / std_stake
+        conviction_z = min(max((z + 3.0) / 6.0, 0.0), 1.0)
+
+    return win_rate, pnl_per_usd, conviction_z
+
+
+def _insider_scores(
+    features: np.ndarray,
+    weights: np.ndarray,
+    score_floor: float,
+    score_ceiling: float,
+) -> np.ndarray:
+    """
+    Compute clipped insider likelihood scores for a batch of wallets.
+
+    Mirrors the NumPy path in compute_wallet_scores, summing each row in the
+    same order so results are bit-identical.
+
+    Args:
+        features: (n, 5) feature matrix
+        weights: Normalized feature weights
+        score_floor: Minimum score
+        score_ceiling: Maximum score
+
+    Returns:
+        Array of n scores
+    """
+    n, k = features.shape
+    scores = np.empty(n, dtype=np.float64)
+    for i in range(n):
+        total = 0.0
+        for j in range(k):
+            total += features[i, j] * weights[j]
+        scores[i] = min(max(total, score_floor), score_ceiling)
+    return scores
+
+
+def _holder_signal(
+    scores: np.ndarray,
+    stake: np.ndarray,
+    side_sign: np.ndarray,
+    max_influence: float,
+) -> tuple[float, float]:
+    """
+    Compute the capped, stake-weighted holder signal.
+
+    Mirrors the NumPy path in compute_market_signal.
+
+    Args:
+        scores: Insider likelihood score per wallet
+        stake: Current stake per wallet (USD)
+        side_sign: +1.0 for YES holders, -1.0 for NO
+        max_influence: Cap on a single wallet's stake weight
+
+    Returns:
+        Tuple of (unclipped holder_signal, total_stake)
+    """
+    total_stake = 0.0
+    for i in range(stake.shape[0]):
+        total_stake += stake[i]
+
+    if total_stake == 0.0:
+        return 0.0, total_stake
+
+    signal = 0.0
+    for i in range(stake.shape[0]):
+        signal += scores[i] * min(stake[i] / total_stake, max_influence) * side_sign[i]
+    return signal, total_stake
+
+
+if HAS_NUMBA:
+    compute_numeric_features = njit(_SIGNATURE, cache=True)(_numeric_features)
+    compute_insider_scores = njit(_SCORES_SIGNATURE, cache=True)(_insider_scores)
+    compute_holder_signal = njit(_HOLDER_SIGNAL_SIGNATURE, cache=True)(_holder_signal)
+else:  # pragma: no cover - optional dependency
+    compute_numeric_features = _numeric_features
+    compute_insider_scores = _insider_scores
+    compute_holder_signal = _holder_signal
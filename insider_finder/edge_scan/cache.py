@@ -0,0 +1,140 @@
+"""
+On-disk cache for HTTP JSON responses.
+
+Lets repeated runs (e.g. while tuning config) reuse wallet history instead of
+refetching it. Backed by a single SQLite file keyed on URL + query params.
+Bodies are stored as the raw response bytes, so callers decode hits with the
+same (fast) decoder as live responses and nothing is re-encoded on write.
+"""
+
+import fnmatch
+import json
+import logging
+import sqlite3
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = Path(".edgescan_cache.sqlite")
+DEFAULT_TTL_SECONDS = 600.0
+
+# Writes are committed in batches so async fetches don't block the event loop
+# on a disk commit per response; anything uncommitted is flushed on close
+DEFAULT_COMMIT_EVERY = 64
+
+# Per-endpoint TTL overrides (seconds), matched against the URL; first match wins
+ENDPOINT_TTLS: dict[str, float] = {
+    "*/book": 30.0,
+    "*/closed-positions": 86400.0,
+    # Gamma market metadata (slug / condition ID lookups) rarely changes
+    "*/markets/slug/*": 21600.0,
+    "*/markets": 21600.0,
+}
+
+
+class ResponseCache:
+    """SQLite-backed cache of JSON responses with per-endpoint TTLs."""
+
+    def __init__(
+        self,
+        path: Path | str = DEFAULT_CACHE_PATH,
+        default_ttl: float = DEFAULT_TTL_SECONDS,
+        endpoint_ttls: dict[str, float] | None = None,
+        commit_every: int = DEFAULT_COMMIT_EVERY,
+    ) -> None:
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: SQLite file path
+            default_ttl: TTL in seconds for URLs without an override
+            endpoint_ttls: URL glob -> TTL overrides (defaults to ENDPOINT_TTLS)
+            commit_every: Commit after this many writes (and always on close)
+        """
+        self.path = Path(path)
+        self.default_ttl = default_ttl
+        self.endpoint_ttls = ENDPOINT_TTLS if endpoint_ttls is None else endpoint_ttls
+        self.commit_every = max(1, commit_every)
+        self._pending_writes = 0
+
+        self._conn = sqlite3.connect(self.path)
+        # Losing the tail of a cache on crash is fine; don't fsync every write
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, expires_at REAL NOT NULL, body BLOB NOT NULL)"
+        )
+
+    def get(self, url: str, params: dict | None = None) -> bytes | None:
+        """
+        Look up a cached response.
+
+        Args:
+            url: Request URL
+            params: Query parameters
+
+        Returns:
+            Raw JSON response body, or None on miss or expiry
+        """
+        row = self._conn.execute(
+            "SELECT expires_at, body FROM responses WHERE key = ?",
+            (self._key(url, params),),
+        ).fetchone()
+
+        if row is None or row[0] < time.time():
+            return None
+
+        logger.debug(f"Cache hit: {url}")
+        return row[1]
+
+    def set(self, url: str, params: dict | None, body: bytes) -> None:
+        """
+        Store a JSON response body.
+
+        Args:
+            url: Request URL
+            params: Query parameters
+            body: Raw JSON response body (already known to decode)
+        """
+        ttl = self.ttl_for(url)
+        if ttl <= 0:
+            return
+
+        self._conn.execute(
+            "INSERT OR REPLACE INTO responses (key, expires_at, body) VALUES (?, ?, ?)",
+            (self._key(url, params), time.time() + ttl, body),
+        )
+
+        # Uncommitted rows are still visible to get() on this connection
+        self._pending_writes += 1
+        if self._pending_writes >= self.commit_every:
+            self.flush()
+
+    def ttl_for(self, url: str) -> float:
+        """Return the TTL in seconds that applies to a URL."""
+        for pattern, ttl in self.endpoint_ttls.items():
+            if fnmatch.fnmatchcase(url, pattern):
+                return ttl
+        return self.default_ttl
+
+    def flush(self) -> None:
+        """Commit any pending writes to disk."""
+        self._conn.commit()
+        self._pending_writes = 0
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        self._conn.execute("DELETE FROM responses")
+        self.flush()
+
+    def close(self) -> None:
+        """Commit pending writes and close the underlying database connection."""
+        self.flush()
+        self._conn.close()
+
+    @staticmethod
+    def _key(url: str, params: dict | None) -> str:
+        """Build a cache key from URL and params, independent of param order."""
+        return f"{url}?{json.dumps(params or {}, sort_keys=True, default=str)}"
@@ -5,22 +5,38 @@ Main entry point for running wallet analysis.
 """
 
 import argparse
+import asyncio
+import dataclasses
 import logging
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
+import httpx
+import numpy as np
+
+from .cache import ResponseCache
 from .config import Config
 from .export import write_csv, write_json, write_markdown, write_run_metadata
 from .features import compute_features
-from .fetchers.clob import get_order_book
-from .fetchers.data_api import get_closed_positions, get_holders, get_trades
+from .fetchers.clob import aget_order_book
+from .fetchers.data_api import (
+    aget_closed_positions,
+    aget_market_trades_by_wallet,
+    aget_trades,
+    get_holders,
+)
 from .fetchers.gamma import resolve_market
-from .models import RunMetadata
+from .models import FeatureVector, Holder, Market, RunMetadata, Trade
 from .scoring import compute_market_signal, compute_wallet_scores
+from .throttle import Throttler
+from .utils import async_client, close_session, set_response_cache
 
 logger = logging.getLogger(__name__)
 
+# (address, username, stake_usd, side, features, sample_size)
+WalletData = tuple[str, str | None, float, str, FeatureVector, int]
+
 
 def setup_logging(verbose: bool = False) -> None:
     """Configure logging."""
@@ -32,6 +48,173 @@ def setup_logging(verbose: bool = False) -> None:
     )
 
 
+async def _wallet_trades(
+    client: httpx.AsyncClient,
+    holder: Holder,
+    market: Market,
+    trades_by_wallet: dict[str, list[Trade]] | None,
+) -> list[Trade] | None:
+    """Return a holder's trades from the market-wide fetch, or fetch them per wallet."""
+    if trades_by_wallet is not None:
+        return trades_by_wallet.get(holder.address.lower(), [])
+
+    return await aget_trades(
+        client,
+        condition_id=market.condition_id,
+        user_address=holder.address,
+    )
+
+
+async def _process_wallet(
+    client: httpx.AsyncClient,
+    holder: Holder,
+    side: str,
+    zero_stake: bool,
+    market: Market,
+    trades_by_wallet: dict[str, list[Trade]] | None,
+    args: argparse.Namespace,
+    cfg: Config,
+) -> WalletData | None:
+    """
+    Fetch history for one holder and compute its features.
+
+    Args:
+        client: Shared AsyncClient
+        holder: Current holder to process
+        side: Holder's current side (YES/NO)
+        zero_stake: Whether the holder has no current stake
+        market: Target market
+        trades_by_wallet: Market trades grouped by wallet, or None to fetch per wallet
+        args: Parsed command-line arguments
+        cfg: Configuration
+
+    Returns:
+        Wallet data tuple for scoring, or None if the wallet is filtered out
+        or its history could not be fetched
+    """
+    title_filter = "earnings" if args.earnings_only else None
+
+    if zero_stake:
+        # Zero-stake wallets are dropped on low activity; decide before fetching trades
+        closed_positions = await aget_closed_positions(
+            client, holder.address, title_filter=title_filter
+        )
+        if closed_positions is None:
+            return None
+
+        total_activity = sum(p.risked_amount for p in closed_positions)
+        if total_activity < cfg.filters.ignore_low_activity_usd:
+            logger.debug("Skipping %s... - no activity and no current stake", holder.address[:8])
+            return None
+
+        trades = await _wallet_trades(client, holder, market, trades_by_wallet)
+    else:
+        # Fetch closed positions and trades concurrently
+        closed_positions, trades = await asyncio.gather(
+            aget_closed_positions(client, holder.address, title_filter=title_filter),
+            _wallet_trades(client, holder, market, trades_by_wallet),
+        )
+
+    # No history rather than an empty one: skip instead of scoring on priors alone
+    if closed_positions is None or trades is None:
+        logger.debug("Skipping %s... - history fetch failed", holder.address[:8])
+        return None
+
+    # Compute features
+    features, sample_size = compute_features(
+        holder.address,
+        holder.amount_usd,
+        closed_positions,
+        trades,
+        cfg,
+    )
+
+    # Always include wallets with current positions, even if no history
+    return (
+        holder.address,
+        holder.username,
+        holder.amount_usd,
+        side,
+        features,
+        sample_size,
+    )
+
+
+async def _scan_holders(
+    holders: list[Holder],
+    market: Market,
+    args: argparse.Namespace,
+    cfg: Config,
+) -> tuple[list[WalletData], float | None]:
+    """
+    Process all holders concurrently, fetching the order book alongside.
+
+    Args:
+        holders: Current holders
+        market: Target market
+        args: Parsed command-line arguments
+        cfg: Configuration
+
+    Returns:
+        Tuple of (wallet data for scoring, YES mid price or None)
+    """
+    completed = 0
+
+    # Per-holder side and stake flags, computed in bulk before any fetches
+    n = len(holders)
+    outcome_index = np.fromiter((h.outcome_index for h in holders), dtype=np.int64, count=n)
+    stake_usd = np.fromiter((h.amount_usd for h in holders), dtype=np.float64, count=n)
+    sides = np.where(outcome_index == 1, "YES", "NO").tolist()
+    zero_stake = (stake_usd == 0).tolist()
+
+    # Every wallet starts at once; the throttler bounds requests in flight,
+    # adapting to the API's rate limiting up to --concurrency
+    throttler = Throttler(c_min=min(2, args.concurrency), c_max=args.concurrency)
+
+    async with async_client(throttler=throttler) as client:
+        # One market-wide trades fetch replaces a trades request per wallet
+        trades_by_wallet = await aget_market_trades_by_wallet(client, market.condition_id)
+
+        async def process(i: int, holder: Holder) -> WalletData | None:
+            nonlocal completed
+            try:
+                return await _process_wallet(
+                    client, holder, sides[i], zero_stake[i], market, trades_by_wallet, args, cfg
+                )
+            finally:
+                completed += 1
+                if completed % 10 == 0:
+                    logger.info("Processed wallet %d/%d...", completed, len(holders))
+
+        book_task = None
+        if args.include_book and market.yes_token_id:
+            logger.info("Fetching order book...")
+            book_task = asyncio.create_task(aget_order_book(client, market.yes_token_id))
+
+        results = await asyncio.gather(
+            *(process(i, h) for i, h in enumerate(holders)), return_exceptions=True
+        )
+        book = await book_task if book_task else None
+
+    logger.debug("Final request concurrency: %d", throttler.concurrency)
+
+    # Order book price signal
+    yes_mid_price = None
+    if book and book.mid_price:
+        yes_mid_price = book.mid_price
+        logger.info(f"YES mid price: {yes_mid_price:.4f}")
+
+    wallets_data = []
+    for holder, result in zip(holders, results):
+        if isinstance(result, Exception):
+            logger.warning("Failed to process %s...: %s", holder.address[:8], result)
+            continue
+        if result is not None:
+            wallets_data.append(result)
+
+    return wallets_data, yes_mid_price
+
+
 def run_analysis(args: argparse.Namespace) -> int:
     """
     Run complete wallet analysis.
@@ -57,6 +240,13 @@ def run_analysis(args: argparse.Namespace) -> int:
         logger.info("Using default configuration")
         cfg = Config.default()
 
+    # Cache HTTP responses on disk so iterative runs skip the network
+    cache = ResponseCache()
+    if args.no_cache:
+        logger.info("Clearing HTTP response cache")
+        cache.clear()
+    set_response_cache(cache)
+
     # Override config with CLI args
     if args.min_sample is not None:
         cfg.history.min_sample = args.min_sample
@@ -75,74 +265,20 @@ def run_analysis(args: argparse.Namespace) -> int:
 
     # Fetch holders
     logger.info("Fetching current holders...")
-    holders = get_holders(market.condition_id, limit=args.limit if hasattr(args, 'limit') else 500)
+    holders = get_holders(
+        market.condition_id,
+        limit=args.limit if hasattr(args, 'limit') else 500,
+        market=market,
+    )
     logger.info(f"Found {len(holders)} holders")
 
     if not holders:
         logger.warning("No holders found - cannot perform analysis")
         return 1
 
-    # Fetch order book for price signal
-    yes_mid_price = None
-    if args.include_book and market.yes_token_id:
-        logger.info("Fetching order book...")
-        book = get_order_book(market.yes_token_id)
-        if book and book.mid_price:
-            yes_mid_price = book.mid_price
-            logger.info(f"YES mid price: {yes_mid_price:.4f}")
-
-    # Process each wallet
-    logger.info("Processing wallets...")
-    wallets_data = []
-
-    for i, holder in enumerate(holders, 1):
-        if i % 10 == 0:
-            logger.info(f"Processing wallet {i}/{len(holders)}...")
-
-        try:
-            # Determine current side
-            side = "YES" if holder.outcome_index == 1 else "NO"
-
-            # Fetch closed positions
-            closed_positions = get_closed_positions(
-                holder.address,
-                title_filter="earnings" if args.earnings_only else None,
-            )
-
-            # Fetch trades
-            trades = get_trades(
-                condition_id=market.condition_id,
-                user_address=holder.address,
-            )
-
-            # Compute features
-            features, sample_size = compute_features(
-                holder.address,
-                holder.amount_usd,
-                closed_positions,
-                trades,
-                cfg,
-            )
-
-            # Filter by minimum activity (but always include if they have current stake)
-            total_activity = sum(abs(p.amount_risked or p.pnl_usd) for p in closed_positions)
-            if total_activity < cfg.filters.ignore_low_activity_usd and holder.amount_usd == 0:
-                logger.debug(f"Skipping {holder.address[:8]}... - no activity and no current stake")
-                continue
-
-            # Always include wallets with current positions, even if no history
-            wallets_data.append((
-                holder.address,
-                holder.username,
-                holder.amount_usd,
-                side,
-                features,
-                sample_size,
-            ))
-
-        except Exception as e:
-            logger.warning(f"Failed to process {holder.address[:8]}...: {e}")
-            continue
+    # Fetch order book and process wallets concurrently over one shared client
+    logger.info(f"Processing wallets (max concurrent requests: {args.concurrency})...")
+    wallets_data, yes_mid_price = asyncio.run(_scan_holders(holders, market, args, cfg))
 
     logger.info(f"Successfully processed {len(wallets_data)} wallets")
 
@@ -154,6 +290,9 @@ def run_analysis(args: argparse.Namespace) -> int:
     logger.info("Computing scores...")
     wallet_scores = compute_wallet_scores(wallets_data, cfg)
 
+    # Rank once; every writer expects scores sorted descending
+    wallet_scores.sort(key=lambda w: w.insider_likelihood_score, reverse=True)
+
     # Compute market signal
     logger.info("Computing market signal...")
     market_signal = compute_market_signal(wallet_scores, yes_mid_price, cfg)
@@ -166,7 +305,7 @@ def run_analysis(args: argparse.Namespace) -> int:
         condition_id=market.condition_id,
         market_title=market.title,
         run_timestamp=datetime.now(timezone.utc),
-        config=cfg.__dict__,
+        config=dataclasses.asdict(cfg),
         holders_analyzed=len(wallets_data),
         holders_scored=sum(1 for w in wallet_scores if not w.low_sample_flag),
         holders_low_sample=sum(1 for w in wallet_scores if w.low_sample_flag),
@@ -195,6 +334,17 @@ def run_analysis(args: argparse.Namespace) -> int:
     return 0
 
 
+def _positive_int(value: str) -> int:
+    """argparse type for options that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: {value!r}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def main() -> int:
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -275,6 +425,19 @@ Examples:
         help="Save results to Markdown report",
     )
 
+    parser.add_argument(
+        "--concurrency",
+        type=_positive_int,
+        default=64,
+        help="Maximum concurrent API requests; adapts down on rate limiting (default: 64)",
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Clear the on-disk HTTP response cache before running",
+    )
+
     parser.add_argument(
         "--verbose",
         "-v",
@@ -290,8 +453,11 @@ Examples:
         args.save_json = True
         args.save_md = True
 
-    if args.command == "run":
-        return run_analysis(args)
+    try:
+        if args.command == "run":
+            return run_analysis(args)
+    finally:
+        close_session()
 
     return 0
 
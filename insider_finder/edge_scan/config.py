@@ -4,11 +4,16 @@ Configuration dataclasses for edge scanner.
 Loads from YAML and provides defaults with validation.
 """
 
+import re
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
 
 import yaml
 
+# A single regex alternative that is a plain word/phrase (no metacharacters)
+_LITERAL_KEYWORD = re.compile(r"[\w ]+")
+
 
 @dataclass
 class HistoryConfig:
@@ -18,6 +23,36 @@ class HistoryConfig:
     lookback_quarters: int = 16
     min_sample: int = 5
 
+    @cached_property
+    def pattern(self) -> re.Pattern[str]:
+        """Compiled earnings title regex, built once per config."""
+        return re.compile(self.earnings_title_regex)
+
+    @cached_property
+    def title_keywords(self) -> tuple[str, ...] | None:
+        """
+        Lowercase keywords when the regex is a case-insensitive literal alternation.
+
+        For patterns like ``(?i)(earnings|EPS|quarterly)`` a substring check on
+        the lowercased title is cheaper than a regex search.
+
+        Returns:
+            Tuple of lowercase keywords, or None if the regex needs the full engine
+        """
+        regex = self.earnings_title_regex
+        if not regex.startswith("(?i)"):
+            return None
+
+        body = regex[len("(?i)"):]
+        if body.startswith("(") and body.endswith(")"):
+            body = body[1:-1]
+
+        keywords = body.split("|")
+        if not all(_LITERAL_KEYWORD.fullmatch(k) for k in keywords):
+            return None
+
+        return tuple(k.lower() for k in keywords)
+
 
 @dataclass
 class Weights:
@@ -3,22 +3,33 @@ Export utilities for writing results to CSV, JSON, and Markdown.
 """
 
 import csv
+import heapq
 import json
 import logging
 from datetime import datetime
 from pathlib import Path
 
+from pydantic import TypeAdapter
+
 from .models import MarketSignal, RunMetadata, WalletScore
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Serializer for the whole wallet list, built once instead of per-model dumps
+_WALLET_SCORES_ADAPTER = TypeAdapter(list[WalletScore])
+
 
 def write_csv(wallet_scores: list[WalletScore], output_path: Path) -> None:
     """
     Write wallet scores to CSV.
 
     Args:
-        wallet_scores: List of wallet scores
+        wallet_scores: List of wallet scores, sorted by score descending
         output_path: Output CSV path
     """
     output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -44,8 +55,8 @@ def write_csv(wallet_scores: list[WalletScore], output_path: Path) -> None:
         ])
 
         # Write rows
-        for score in sorted(wallet_scores, key=lambda x: x.insider_likelihood_score, reverse=True):
-            writer.writerow([
+        writer.writerows(
+            (
                 score.address,
                 score.username or "",
                 f"{score.current_stake_usd:.2f}",
@@ -59,7 +70,9 @@ def write_csv(wallet_scores: list[WalletScore], output_path: Path) -> None:
                 f"{score.signed_contribution:.2f}",
                 score.sample_size,
                 score.low_sample_flag,
-            ])
+            )
+            for score in wallet_scores
+        )
 
     logger.info(f"Wrote {len(wallet_scores)} wallet scores to {output_path}")
 
@@ -84,11 +97,10 @@ def write_json(
     data = {
         "metadata": run_meta.model_dump(mode="json"),
         "market_signal": market_signal.model_dump(mode="json"),
-        "wallets": [score.model_dump(mode="json") for score in wallet_scores],
+        "wallets": _WALLET_SCORES_ADAPTER.dump_python(wallet_scores, mode="json"),
     }
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, default=str)
+    _dump_json(data, output_path)
 
     logger.info(f"Wrote JSON output to {output_path}")
 
@@ -103,68 +115,69 @@ def write_markdown(
     Write human-readable markdown report.
 
     Args:
-        wallet_scores: List of wallet scores
+        wallet_scores: List of wallet scores (any order)
         market_signal: Market signal
         run_meta: Run metadata
         output_path: Output markdown path
     """
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        # Header
-        f.write(f"# Polymarket Holder Edge Analysis\n\n")
-        f.write(f"**Market:** {run_meta.market_title}\n\n")
-        f.write(f"**Condition ID:** `{run_meta.condition_id}`\n\n")
-        f.write(f"**Analysis Time:** {run_meta.run_timestamp.strftime('%Y-%m-%d %H:%M:%S UTC')}\n\n")
-
-        # Market Signal
-        f.write(f"## Market Signal\n\n")
-        f.write(f"- **Direction:** {market_signal.direction}\n")
-        f.write(f"- **Final Score:** {market_signal.final_score:.4f}\n")
-        f.write(f"- **Holder Signal:** {market_signal.holder_signal:.4f}\n")
-        if market_signal.dir_score is not None:
-            f.write(f"- **Price Direction Score:** {market_signal.dir_score:.4f}\n")
-        f.write(f"- **Wallets Analyzed:** {market_signal.top_wallets_count}\n")
-        f.write(f"- **Total Stake:** ${market_signal.total_stake_usd:,.2f}\n\n")
-
-        # Summary Stats
-        f.write(f"## Summary\n\n")
-        f.write(f"- **Total Holders Analyzed:** {run_meta.holders_analyzed}\n")
-        f.write(f"- **Holders with Full Scores:** {run_meta.holders_scored}\n")
-        f.write(f"- **Holders with Low Sample:** {run_meta.holders_low_sample}\n\n")
-
-        # Top Wallets
-        f.write(f"## Top 20 Wallets by Insider Likelihood Score\n\n")
-        f.write(f"| Rank | Address | Stake USD | Side | Score | Win Rate | PnL/USD | Sample | Low Sample |\n")
-        f.write(f"|------|---------|-----------|------|-------|----------|---------|--------|------------|\n")
-
-        sorted_wallets = sorted(wallet_scores, key=lambda x: x.insider_likelihood_score, reverse=True)[:20]
-
-        for i, score in enumerate(sorted_wallets, 1):
-            addr_short = f"{score.address[:6]}...{score.address[-4:]}"
-            f.write(
-                f"| {i} | `{addr_short}` | ${score.current_stake_usd:,.0f} | "
-                f"{score.current_side} | {score.insider_likelihood_score:.3f} | "
-                f"{score.features.win_rate:.3f} | {score.features.pnl_per_usd:.3f} | "
-                f"{score.sample_size} | {'Yes' if score.low_sample_flag else 'No'} |\n"
-            )
-
-        # Caveats
-        f.write(f"\n## Important Caveats\n\n")
-        f.write(f"- **Behavioral Analysis Only:** Scores represent behavioral likelihood of informational edge based on historical patterns.\n")
-        f.write(f"- **No Legal Assertion:** This tool makes no claims about illegal activity or insider trading.\n")
-        f.write(f"- **Historical Performance:** Past performance does not guarantee future results.\n")
-        f.write(f"- **Sample Size:** Wallets with `Low Sample = Yes` have limited historical data and scores may be unreliable.\n")
-        f.write(f"- **Market Context:** Always consider broader market conditions and fundamental analysis.\n\n")
-
-        # Glossary
-        f.write(f"## Glossary\n\n")
-        f.write(f"- **Insider Likelihood Score:** Weighted combination of behavioral edge features [0-1]\n")
-        f.write(f"- **Win Rate:** Historical success rate on earnings markets, weighted by stake size\n")
-        f.write(f"- **PnL/USD:** Median profit/loss ratio per dollar risked\n")
-        f.write(f"- **Timing Edge:** Activity concentration near resolution events\n")
-        f.write(f"- **Conviction Z:** How unusual current stake is vs historical distribution\n")
-        f.write(f"- **Consistency:** Directional alignment within ticker/sector\n\n")
+    parts: list[str] = []
+
+    # Header
+    parts.append("# Polymarket Holder Edge Analysis\n\n")
+    parts.append(f"**Market:** {run_meta.market_title}\n\n")
+    parts.append(f"**Condition ID:** `{run_meta.condition_id}`\n\n")
+    parts.append(f"**Analysis Time:** {run_meta.run_timestamp.strftime('%Y-%m-%d %H:%M:%S UTC')}\n\n")
+
+    # Market Signal
+    parts.append("## Market Signal\n\n")
+    parts.append(f"- **Direction:** {market_signal.direction}\n")
+    parts.append(f"- **Final Score:** {market_signal.final_score:.4f}\n")
+    parts.append(f"- **Holder Signal:** {market_signal.holder_signal:.4f}\n")
+    if market_signal.dir_score is not None:
+        parts.append(f"- **Price Direction Score:** {market_signal.dir_score:.4f}\n")
+    parts.append(f"- **Wallets Analyzed:** {market_signal.top_wallets_count}\n")
+    parts.append(f"- **Total Stake:** ${market_signal.total_stake_usd:,.2f}\n\n")
+
+    # Summary Stats
+    parts.append("## Summary\n\n")
+    parts.append(f"- **Total Holders Analyzed:** {run_meta.holders_analyzed}\n")
+    parts.append(f"- **Holders with Full Scores:** {run_meta.holders_scored}\n")
+    parts.append(f"- **Holders with Low Sample:** {run_meta.holders_low_sample}\n\n")
+
+    # Top Wallets
+    parts.append("## Top 20 Wallets by Insider Likelihood Score\n\n")
+    parts.append("| Rank | Address | Stake USD | Side | Score | Win Rate | PnL/USD | Sample | Low Sample |\n")
+    parts.append("|------|---------|-----------|------|-------|----------|---------|--------|------------|\n")
+    parts.extend(
+        f"| {i} | `{score.address[:6]}...{score.address[-4:]}` | ${score.current_stake_usd:,.0f} | "
+        f"{score.current_side} | {score.insider_likelihood_score:.3f} | "
+        f"{score.features.win_rate:.3f} | {score.features.pnl_per_usd:.3f} | "
+        f"{score.sample_size} | {'Yes' if score.low_sample_flag else 'No'} |\n"
+        for i, score in enumerate(
+            heapq.nlargest(20, wallet_scores, key=lambda x: x.insider_likelihood_score), 1
+        )
+    )
+
+    # Caveats
+    parts.append("\n## Important Caveats\n\n")
+    parts.append("- **Behavioral Analysis Only:** Scores represent behavioral likelihood of informational edge based on historical patterns.\n")
+    parts.append("- **No Legal Assertion:** This tool makes no claims about illegal activity or insider trading.\n")
+    parts.append("- **Historical Performance:** Past performance does not guarantee future results.\n")
+    parts.append("- **Sample Size:** Wallets with `Low Sample = Yes` have limited historical data and scores may be unreliable.\n")
+    parts.append("- **Market Context:** Always consider broader market conditions and fundamental analysis.\n\n")
+
+    # Glossary
+    parts.append("## Glossary\n\n")
+    parts.append("- **Insider Likelihood Score:** Weighted combination of behavioral edge features [0-1]\n")
+    parts.append("- **Win Rate:** Historical success rate on earnings markets, weighted by stake size\n")
+    parts.append("- **PnL/USD:** Median profit/loss ratio per dollar risked\n")
+    parts.append("- **Timing Edge:** Activity concentration near resolution events\n")
+    parts.append("- **Conviction Z:** How unusual current stake is vs historical distribution\n")
+    parts.append("- **Consistency:** Directional alignment within ticker/sector\n\n")
+
+    output_path.write_text("".join(parts), encoding="utf-8")
 
     logger.info(f"Wrote markdown report to {output_path}")
 
@@ -179,7 +192,16 @@ def write_run_metadata(run_meta: RunMetadata, output_path: Path) -> None:
     """
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(run_meta.model_dump(mode="json"), f, indent=2, default=str)
+    _dump_json(run_meta.model_dump(mode="json"), output_path)
 
     logger.info(f"Wrote run metadata to {output_path}")
+
+
+def _dump_json(data: dict, output_path: Path) -> None:
+    """Write indented JSON in one call, using orjson when installed."""
+    if orjson is not None:
+        output_path.write_bytes(orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2))
+        return
+
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, default=str)
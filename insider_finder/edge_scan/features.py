@@ -5,12 +5,14 @@ Computes behavioral edge features from trading history.
 """
 
 import logging
-import re
 from datetime import datetime, timedelta
 
+import numpy as np
+
+from ._kernels import HAS_NUMBA, compute_numeric_features
 from .config import Config
 from .models import ClosedPosition, FeatureVector, Trade
-from .utils import clip, normalize_to_unit, shrink_to_prior, weighted_mean, winsorize
+from .utils import clip, normalize_to_unit, shrink_to_prior
 
 logger = logging.getLogger(__name__)
 
@@ -36,16 +38,36 @@ def compute_features(
         Tuple of (FeatureVector, sample_size)
     """
     # Filter for earnings-related positions
-    pattern = re.compile(cfg.history.earnings_title_regex)
-    earnings_positions = [p for p in closed_positions if pattern.search(p.title)]
+    keywords = cfg.history.title_keywords
+    if keywords is not None:
+        earnings_positions = [
+            p for p in closed_positions if _title_has_keyword(p.title, keywords)
+        ]
+    else:
+        pattern = cfg.history.pattern
+        earnings_positions = [p for p in closed_positions if pattern.search(p.title)]
 
     sample_size = len(earnings_positions)
 
+    # Pack positions into arrays once; every numeric feature reuses them
+    pnl, risked, won = _positions_to_arrays(earnings_positions)
+
     # Compute individual features
-    win_rate = _compute_win_rate(earnings_positions, cfg)
-    pnl_per_usd = _compute_pnl_per_usd(earnings_positions, cfg)
+    if HAS_NUMBA:
+        win_rate, pnl_per_usd, conviction_z = compute_numeric_features(
+            pnl,
+            risked,
+            won,
+            float(current_stake_usd),
+            cfg.caps.feature_clip_pct,
+            cfg.scoring.shrinkage_prior,
+            cfg.history.min_sample,
+        )
+    else:
+        win_rate = _compute_win_rate(risked, won, cfg)
+        pnl_per_usd = _compute_pnl_per_usd(pnl, risked, cfg)
+        conviction_z = _compute_conviction_z(current_stake_usd, risked, cfg)
     timing_edge = _compute_timing_edge(trades, cfg)
-    conviction_z = _compute_conviction_z(current_stake_usd, earnings_positions, cfg)
     consistency = _compute_consistency(earnings_positions, cfg)
 
     return (
@@ -60,53 +82,74 @@ def compute_features(
     )
 
 
-def _compute_win_rate(positions: list[ClosedPosition], cfg: Config) -> float:
-    """Compute size-weighted win rate with shrinkage."""
-    if not positions:
-        return cfg.scoring.shrinkage_prior
+def _title_has_keyword(title: str, keywords: tuple[str, ...]) -> bool:
+    """Check a title against lowercase keywords, lowercasing the title once."""
+    title = title.lower()
+    return any(k in title for k in keywords)
 
-    winners = [p for p in positions if p.was_winner]
-    stakes = [abs(p.amount_risked or p.pnl_usd) for p in positions]
 
-    if sum(stakes) == 0:
+def _positions_to_arrays(
+    positions: list[ClosedPosition],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Pack positions into parallel float64 arrays.
+
+    Args:
+        positions: Closed positions
+
+    Returns:
+        Tuple of (pnl, risked, won) where risked is ClosedPosition.risked_amount
+        and won is 1.0 for winning positions
+    """
+    n = len(positions)
+    pnl = np.fromiter((p.pnl_usd for p in positions), dtype=np.float64, count=n)
+    risked = np.fromiter((p.risked_amount for p in positions), dtype=np.float64, count=n)
+    won = np.fromiter((p.was_winner for p in positions), dtype=np.float64, count=n)
+    return pnl, risked, won
+
+
+def _compute_win_rate(risked: np.ndarray, won: np.ndarray, cfg: Config) -> float:
+    """Compute size-weighted win rate with shrinkage."""
+    if won.size == 0:
         return cfg.scoring.shrinkage_prior
 
-    win_values = [1.0 if p.was_winner else 0.0 for p in positions]
+    if risked.sum() == 0:
+        return cfg.scoring.shrinkage_prior
 
-    observed_wr = weighted_mean(win_values, stakes)
+    observed_wr = float(np.average(won, weights=risked))
 
     # Apply shrinkage
     shrunk_wr = shrink_to_prior(
         observed_wr,
         cfg.scoring.shrinkage_prior,
-        len(positions),
+        won.size,
         cfg.history.min_sample,
     )
 
     return clip(shrunk_wr, 0.0, 1.0)
 
 
-def _compute_pnl_per_usd(positions: list[ClosedPosition], cfg: Config) -> float:
+def _compute_pnl_per_usd(pnl: np.ndarray, risked: np.ndarray, cfg: Config) -> float:
     """Compute PnL per USD risked with winsorization."""
-    if not positions:
+    mask = risked > 0
+    if not mask.any():
         return 0.5
 
-    pnl_ratios = []
-    for p in positions:
-        risked = abs(p.amount_risked or p.pnl_usd)
-        if risked > 0:
-            ratio = p.pnl_usd / risked
-            pnl_ratios.append(ratio)
+    ratios = pnl[mask] / risked[mask]
+    n = ratios.size
 
-    if not pnl_ratios:
-        return 0.5
+    # Winsorize at the same order statistics as utils.winsorize
+    clip_pct = cfg.caps.feature_clip_pct
+    lower_idx = int(n * (1 - clip_pct) / 2)
+    upper_idx = int(n * (1 + clip_pct) / 2)
+    lower_idx = lower_idx if lower_idx < n else 0
+    upper_idx = upper_idx if upper_idx < n else n - 1
 
-    # Winsorize
-    winsorized = winsorize(pnl_ratios, cfg.caps.feature_clip_pct)
+    # Only three order statistics are needed, so partition instead of sorting
+    part = np.partition(ratios, [lower_idx, n // 2, upper_idx])
 
-    # Take median
-    sorted_ratios = sorted(winsorized)
-    median_pnl = sorted_ratios[len(sorted_ratios) // 2]
+    # Take median (clipping the median is the median of the winsorized values)
+    median_pnl = float(np.clip(part[n // 2], part[lower_idx], part[upper_idx]))
 
     # Normalize to [0, 1] - assume typical range [-0.5, 1.5]
     normalized = normalize_to_unit(median_pnl, -0.5, 1.5)
@@ -125,30 +168,23 @@ def _compute_timing_edge(trades: list[Trade], cfg: Config) -> float:
     return 0.5
 
 
-def _compute_conviction_z(
-    current_stake: float, positions: list[ClosedPosition], cfg: Config
-) -> float:
+def _compute_conviction_z(current_stake: float, risked: np.ndarray, cfg: Config) -> float:
     """
     Compute conviction Z-score.
 
     How unusual is current stake vs historical distribution.
     """
-    if not positions:
-        return 0.5
-
-    stakes = [abs(p.amount_risked or p.pnl_usd) for p in positions if p.amount_risked or p.pnl_usd]
+    stakes = risked[risked != 0]
 
-    if not stakes:
+    if stakes.size == 0:
         return 0.5
 
-    mean_stake = sum(stakes) / len(stakes)
-    variance = sum((s - mean_stake) ** 2 for s in stakes) / len(stakes)
-    std_stake = variance**0.5
+    std_stake = float(stakes.std())
 
     if std_stake == 0:
         return 0.5
 
-    z = (current_stake - mean_stake) / std_stake
+    z = (current_stake - float(stakes.mean())) / std_stake
 
     # Normalize Z-score to [0, 1] assuming range [-3, 3]
     normalized = normalize_to_unit(z, -3.0, 3.0)
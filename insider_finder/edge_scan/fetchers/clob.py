@@ -6,8 +6,10 @@ Fetches order book snapshots for price discovery.
 
 import logging
 
+import httpx
+
 from ..models import OrderBook
-from ..utils import http_get
+from ..utils import http_get, http_get_async
 
 logger = logging.getLogger(__name__)
 
@@ -35,30 +37,63 @@ def get_order_book(token_id: str) -> OrderBook | None:
         logger.warning(f"Failed to fetch order book: {e}")
         return None
 
-    # Parse order book
-    bids = []
-    asks = []
-
-    if "bids" in data:
-        for bid in data["bids"]:
-            if isinstance(bid, dict):
-                price = float(bid.get("price", 0))
-                size = float(bid.get("size", 0))
-                bids.append((price, size))
-
-    if "asks" in data:
-        for ask in data["asks"]:
-            if isinstance(ask, dict):
-                price = float(ask.get("price", 0))
-                size = float(ask.get("size", 0))
-                asks.append((price, size))
-
-    book = OrderBook(token_id=token_id, bids=bids, asks=asks)
-    book.mid_price = book.calculate_mid()
-
-    if book.mid_price and bids and asks:
-        best_bid = max(bids, key=lambda x: x[0])[0]
-        best_ask = min(asks, key=lambda x: x[0])[0]
-        book.spread = best_ask - best_bid
-
-    return book
+    return _parse_order_book(token_id, data)
+
+
+async def aget_order_book(client: httpx.AsyncClient, token_id: str) -> OrderBook | None:
+    """
+    Async variant of :func:`get_order_book` using a shared AsyncClient.
+
+    Args:
+        client: Shared AsyncClient
+        token_id: Token ID
+
+    Returns:
+        OrderBook object or None if fetch fails
+    """
+    url = f"{CLOB_BASE_URL}/book"
+    params = {"token_id": token_id}
+
+    logger.debug(f"Fetching order book for token {token_id}")
+
+    try:
+        data = await http_get_async(client, url, params=params)
+    except Exception as e:
+        logger.warning(f"Failed to fetch order book: {e}")
+        return None
+
+    return _parse_order_book(token_id, data)
+
+
+def _parse_order_book(token_id: str, data: dict) -> OrderBook:
+    """Parse order book response into an OrderBook."""
+    # OrderBook sorts its levels best first, so the top of book is bids[0] / asks[0]
+    book = OrderBook(
+        token_id=token_id,
+        bids=_parse_levels(data.get("bids")),
+        asks=_parse_levels(data.get("asks")),
+    )
+
+    mid_price = book.calculate_mid()
+    if mid_price is None:
+        return book
+
+    spread = book.asks[0][0] - book.bids[0][0] if mid_price else None
+    return book.model_copy(update={"mid_price": mid_price, "spread": spread})
+
+
+def _parse_levels(levels: list | None) -> list[tuple[float, float]]:
+    """
+    Parse price levels.
+
+    Args:
+        levels: Raw list of {"price", "size"} level dicts
+
+    Returns:
+        List of (price, size) levels in response order
+    """
+    return [
+        (float(level.get("price", 0)), float(level.get("size", 0)))
+        for level in levels or ()
+        if isinstance(level, dict)
+    ]
@@ -4,40 +4,181 @@ Data API fetcher for holders, trades, and closed positions.
 Uses Polymarket Data API for wallet activity data.
 """
 
+import asyncio
 import logging
-from datetime import datetime
+import time
+from typing import Callable
 
-from ..models import ClosedPosition, Holder, Trade
-from ..utils import http_get, parse_datetime
+import httpx
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from ..models import ClosedPosition, Holder, Market, Trade
+from ..utils import async_client, http_get, http_get_async, parse_timestamp_ns
+from .subgraph import get_top_holders_subgraph
 
 logger = logging.getLogger(__name__)
 
 DATA_API_BASE_URL = "https://data-api.polymarket.com"
 
+# Market-wide trade fetch: page size and cap before falling back to per-wallet fetches
+MARKET_TRADES_PAGE_SIZE = 1000
+MARKET_TRADES_MAX = 10000
+
+# Whole responses are validated in one pydantic-core call rather than per record
+_HOLDERS_ADAPTER = TypeAdapter(list[Holder])
+_TRADES_ADAPTER = TypeAdapter(list[Trade])
+_CLOSED_POSITIONS_ADAPTER = TypeAdapter(list[ClosedPosition])
+
 
-def get_holders(condition_id: str, limit: int = 500) -> list[Holder]:
+def get_holders(
+    condition_id: str, limit: int = 500, market: Market | None = None
+) -> list[Holder]:
     """
     Fetch current holders for a market.
 
+    Synchronous wrapper around :func:`aget_holders`.
+
     Args:
         condition_id: Market condition ID
-        limit: Maximum number of holders to fetch
+        limit: Maximum number of holders to fetch per outcome token
+        market: Resolved market; enables the subgraph fallback when the
+            Data API caps holders
 
     Returns:
         List of Holder objects
     """
-    url = f"{DATA_API_BASE_URL}/holders"
-    params = {"market": condition_id, "limit": limit}
 
+    async def _fetch() -> list[Holder]:
+        async with async_client() as client:
+            return await aget_holders(client, condition_id, limit=limit, market=market)
+
+    return asyncio.run(_fetch())
+
+
+async def aget_holders(
+    client: httpx.AsyncClient,
+    condition_id: str,
+    limit: int = 500,
+    market: Market | None = None,
+) -> list[Holder]:
+    """
+    Fetch current holders for a market.
+
+    The first page asks for the full ``limit``. If the API caps it short of
+    ``limit``, a second page at that offset probes whether the endpoint
+    honours offsets; only if it returns new holders are the remaining
+    pages requested, in parallel. If offsets are ignored, the Data API
+    cannot return more, so holders missing from it are filled in from the
+    subgraph (when ``market`` is given).
+
+    Args:
+        client: Shared AsyncClient
+        condition_id: Market condition ID
+        limit: Maximum number of holders to fetch per outcome token
+        market: Resolved market, needed for the subgraph fallback
+
+    Returns:
+        List of Holder objects, de-duplicated by (address, outcome)
+    """
     logger.info(f"Fetching holders for condition_id: {condition_id}")
 
+    holders, page_size = await _aget_holders_page(client, condition_id, limit, 0)
+    capped = False
+
+    # Largest per-token group shorter than requested: either all holders, or a server cap
+    if 0 < page_size < limit:
+        probe, _ = await _aget_holders_page(
+            client, condition_id, min(page_size, limit - page_size), page_size
+        )
+        seen = {(h.address, h.outcome_index) for h in holders}
+
+        if any((h.address, h.outcome_index) not in seen for h in probe):
+            holders.extend(probe)
+            pages = await asyncio.gather(
+                *(
+                    _aget_holders_page(
+                        client, condition_id, min(page_size, limit - offset), offset
+                    )
+                    for offset in range(2 * page_size, limit, page_size)
+                )
+            )
+            for page_holders, _ in pages:
+                holders.extend(page_holders)
+        else:
+            # Offset ignored (same holders again) means the page may be a server cap;
+            # an empty probe means offsets work and there is nothing more to fetch
+            capped = bool(probe)
+
+    # Pages can overlap if the holder set shifts between requests; keep the first occurrence
+    unique: dict[tuple[str, int], Holder] = {}
+    for holder in holders:
+        unique.setdefault((holder.address, holder.outcome_index), holder)
+    holders = list(unique.values())
+
+    if capped and market is not None:
+        holders = await _add_subgraph_holders(holders, market, limit)
+
+    logger.info(f"Found {len(holders)} holders")
+    return holders
+
+
+async def _add_subgraph_holders(
+    holders: list[Holder], market: Market, limit: int
+) -> list[Holder]:
+    """
+    Fill in holders the capped Data API left out, from the subgraph.
+
+    Data API holders are kept as they are; subgraph holders not already
+    present are added, largest position first, up to ``limit`` per outcome.
+    Only the top ``limit`` holders per outcome are queried, so for a market
+    with fewer holders than the cap this costs one query per outcome and
+    adds nothing.
+    """
+    logger.info("Data API holder list is capped; filling in holders from the subgraph")
+    subgraph_holders = await asyncio.to_thread(get_top_holders_subgraph, market, limit)
+
+    seen = {(h.address.lower(), h.outcome_index) for h in holders}
+    per_outcome: dict[int, int] = {}
+    for holder in holders:
+        per_outcome[holder.outcome_index] = per_outcome.get(holder.outcome_index, 0) + 1
+
+    added = 0
+    for holder in sorted(subgraph_holders, key=lambda h: h.amount_usd, reverse=True):
+        key = (holder.address.lower(), holder.outcome_index)
+        if key in seen or per_outcome.get(holder.outcome_index, 0) >= limit:
+            continue
+        seen.add(key)
+        per_outcome[holder.outcome_index] = per_outcome.get(holder.outcome_index, 0) + 1
+        holders.append(holder)
+        added += 1
+
+    if added:
+        logger.info(f"Added {added} holders from the subgraph")
+    return holders
+
+
+async def _aget_holders_page(
+    client: httpx.AsyncClient,
+    condition_id: str,
+    limit: int,
+    offset: int,
+) -> tuple[list[Holder], int]:
+    """
+    Fetch one page of holders.
+
+    Returns:
+        Tuple of (holders, size of the largest per-token holder group)
+    """
+    url = f"{DATA_API_BASE_URL}/holders"
+    params = {"market": condition_id, "limit": limit}
+    if offset:
+        params["offset"] = offset
+
     try:
-        data = http_get(url, params=params)
+        data = await http_get_async(client, url, params=params)
     except Exception as e:
         logger.error(f"Failed to fetch holders: {e}")
-        return []
-
-    holders = []
+        return [], 0
 
     # API might return dict with 'data' key or direct list
     if isinstance(data, dict) and "data" in data:
@@ -45,32 +186,27 @@ def get_holders(condition_id: str, limit: int = 500) -> list[Holder]:
 
     if not isinstance(data, list):
         logger.warning(f"Unexpected holders response format: {type(data)}")
-        return []
+        return [], 0
 
     # API returns array of tokens, each with nested holders array
-    for token_group in data:
-        if not isinstance(token_group, dict):
-            continue
+    token_holders = [g.get("holders", []) for g in data if isinstance(g, dict)]
+    largest_group = max(map(len, token_holders), default=0)
 
-        token_id = token_group.get("token")
-        token_holders = token_group.get("holders", [])
+    rows = [
+        row
+        for group in token_holders
+        for holder_data in group
+        if (row := _safe_parse(_holder_fields, holder_data, "holder")) is not None
+    ]
 
-        for holder_data in token_holders:
-            try:
-                holders.append(_parse_holder(holder_data))
-            except Exception as e:
-                logger.warning(f"Failed to parse holder: {e}")
-                continue
-
-    logger.info(f"Found {len(holders)} holders")
-    return holders
+    return _validate_rows(_HOLDERS_ADAPTER, Holder, rows), largest_group
 
 
 def get_trades(
     condition_id: str | None = None,
     user_address: str | None = None,
     limit: int = 1000,
-) -> list[Trade]:
+) -> list[Trade] | None:
     """
     Fetch trades for a market and/or user.
 
@@ -80,48 +216,135 @@ def get_trades(
         limit: Maximum number of trades
 
     Returns:
-        List of Trade objects
+        List of Trade objects, or None if the fetch failed or the response
+        was malformed (callers should skip the wallet)
     """
     url = f"{DATA_API_BASE_URL}/trades"
-    params = {"limit": limit}
+    params = _trades_params(condition_id, user_address, limit)
 
-    if condition_id:
-        params["market"] = condition_id
-    if user_address:
-        params["user"] = user_address
+    try:
+        data = http_get(url, params=params)
+    except Exception as e:
+        logger.error(f"Failed to fetch trades: {e}")
+        return None
+
+    return _parse_trades_response(data)
 
-    logger.debug(f"Fetching trades (market={condition_id}, user={user_address[:8] if user_address else None}...)")
+
+async def aget_trades(
+    client: httpx.AsyncClient,
+    condition_id: str | None = None,
+    user_address: str | None = None,
+    limit: int = 1000,
+) -> list[Trade] | None:
+    """
+    Async variant of :func:`get_trades` using a shared AsyncClient.
+
+    Args:
+        client: Shared AsyncClient
+        condition_id: Market condition ID (optional)
+        user_address: User wallet address (optional)
+        limit: Maximum number of trades
+
+    Returns:
+        List of Trade objects, or None if the fetch failed or the response
+        was malformed (callers should skip the wallet)
+    """
+    url = f"{DATA_API_BASE_URL}/trades"
+    params = _trades_params(condition_id, user_address, limit)
 
     try:
-        data = http_get(url, params=params)
+        data = await http_get_async(client, url, params=params)
     except Exception as e:
         logger.error(f"Failed to fetch trades: {e}")
-        return []
+        return None
 
-    trades = []
+    return _parse_trades_response(data)
 
-    if isinstance(data, dict) and "data" in data:
-        data = data["data"]
 
-    if not isinstance(data, list):
-        logger.warning(f"Unexpected trades response format: {type(data)}")
-        return []
+async def aget_market_trades_by_wallet(
+    client: httpx.AsyncClient,
+    condition_id: str,
+    max_trades: int = MARKET_TRADES_MAX,
+    page_size: int = MARKET_TRADES_PAGE_SIZE,
+) -> dict[str, list[Trade]] | None:
+    """
+    Fetch every trade in a market and group it by wallet.
+
+    Replaces one trades request per holder with a few market-wide pages.
+    Pages are read until an empty page comes back, so the result is only
+    returned when it is known to be complete.
+
+    Args:
+        client: Shared AsyncClient
+        condition_id: Market condition ID
+        max_trades: Give up (return None) once this many trades were read
+        page_size: Trades requested per page
+
+    Returns:
+        Dict of lowercase wallet address -> trades, or None if the fetch
+        failed or the market is too large (callers should then fetch per wallet)
+    """
+    url = f"{DATA_API_BASE_URL}/trades"
+    wallets: list[str] = []
+    rows: list[dict] = []
+    offset = 0
+
+    while offset < max_trades:
+        params = {"market": condition_id, "limit": page_size, "offset": offset}
 
-    for item in data:
         try:
-            trades.append(_parse_trade(item))
+            data = await http_get_async(client, url, params=params)
         except Exception as e:
-            logger.warning(f"Failed to parse trade: {e}")
-            continue
+            logger.warning(f"Failed to fetch market trades: {e}")
+            return None
+
+        if isinstance(data, dict) and "data" in data:
+            data = data["data"]
+
+        if not isinstance(data, list):
+            logger.warning(f"Unexpected trades response format: {type(data)}")
+            return None
+
+        if not data:
+            return _group_trades(wallets, rows)
+
+        for item in data:
+            if not isinstance(item, dict):
+                continue
+            wallet = item.get("proxyWallet") or item.get("user")
+            if not wallet:
+                continue
+            row = _safe_parse(_trade_fields, item, "trade")
+            if row is None:
+                continue
+            rows.append(row)
+            wallets.append(wallet.lower())
+
+        offset += len(data)
 
-    return trades
+    logger.info(f"Market has over {max_trades} trades; fetching trades per wallet instead")
+    return None
+
+
+def _group_trades(wallets: list[str], rows: list[dict]) -> dict[str, list[Trade]]:
+    """Group market-wide trade rows by wallet and validate each wallet's rows in bulk."""
+    rows_by_wallet: dict[str, list[dict]] = {}
+    for wallet, row in zip(wallets, rows):
+        rows_by_wallet.setdefault(wallet, []).append(row)
+
+    grouped = {
+        wallet: _validate_rows(_TRADES_ADAPTER, Trade, wallet_rows)
+        for wallet, wallet_rows in rows_by_wallet.items()
+    }
+    return {wallet: trades for wallet, trades in grouped.items() if trades}
 
 
 def get_closed_positions(
     user_address: str,
     title_filter: str | None = None,
     limit: int = 500,
-) -> list[ClosedPosition]:
+) -> list[ClosedPosition] | None:
     """
     Fetch closed positions for a user.
 
@@ -131,43 +354,155 @@ def get_closed_positions(
         limit: Maximum number of positions
 
     Returns:
-        List of ClosedPosition objects
+        List of ClosedPosition objects, or None if the fetch failed or the
+        response was malformed (callers should skip the wallet)
     """
     url = f"{DATA_API_BASE_URL}/closed-positions"
-    params = {"user": user_address, "limit": limit}
+    params = _closed_positions_params(user_address, title_filter, limit)
 
-    if title_filter:
-        params["title"] = title_filter
+    try:
+        data = http_get(url, params=params)
+    except Exception as e:
+        logger.warning(f"Failed to fetch closed positions for {user_address[:8]}: {e}")
+        return None
 
-    logger.debug(f"Fetching closed positions for {user_address[:8]}...")
+    return _parse_closed_positions_response(data)
+
+
+async def aget_closed_positions(
+    client: httpx.AsyncClient,
+    user_address: str,
+    title_filter: str | None = None,
+    limit: int = 500,
+) -> list[ClosedPosition] | None:
+    """
+    Async variant of :func:`get_closed_positions` using a shared AsyncClient.
+
+    Args:
+        client: Shared AsyncClient
+        user_address: User wallet address
+        title_filter: Optional title filter (e.g., "earnings")
+        limit: Maximum number of positions
+
+    Returns:
+        List of ClosedPosition objects, or None if the fetch failed or the
+        response was malformed (callers should skip the wallet)
+    """
+    url = f"{DATA_API_BASE_URL}/closed-positions"
+    params = _closed_positions_params(user_address, title_filter, limit)
 
     try:
-        data = http_get(url, params=params)
+        data = await http_get_async(client, url, params=params)
     except Exception as e:
         logger.warning(f"Failed to fetch closed positions for {user_address[:8]}: {e}")
+        return None
+
+    return _parse_closed_positions_response(data)
+
+
+def _trades_params(condition_id: str | None, user_address: str | None, limit: int) -> dict:
+    """Build query parameters for the trades endpoint."""
+    params: dict = {"limit": limit}
+
+    if condition_id:
+        params["market"] = condition_id
+    if user_address:
+        params["user"] = user_address
+
+    logger.debug("Fetching trades (market=%s, user=%s...)", condition_id, user_address and user_address[:8])
+
+    return params
+
+
+def _parse_trades_response(data: dict | list) -> list[Trade] | None:
+    """Parse trades endpoint response into Trade objects (None if malformed)."""
+    if isinstance(data, dict) and "data" in data:
+        data = data["data"]
+
+    if not isinstance(data, list):
+        logger.warning(f"Unexpected trades response format: {type(data)}")
+        return None
+
+    if not data:
         return []
 
-    positions = []
+    rows = [row for item in data if (row := _safe_parse(_trade_fields, item, "trade")) is not None]
 
+    return _validate_rows(_TRADES_ADAPTER, Trade, rows)
+
+
+def _closed_positions_params(user_address: str, title_filter: str | None, limit: int) -> dict:
+    """Build query parameters for the closed-positions endpoint."""
+    params: dict = {"user": user_address, "limit": limit}
+
+    if title_filter:
+        params["title"] = title_filter
+
+    logger.debug("Fetching closed positions for %s...", user_address[:8])
+
+    return params
+
+
+def _parse_closed_positions_response(data: dict | list) -> list[ClosedPosition] | None:
+    """Parse closed-positions endpoint response into ClosedPosition objects (None if malformed)."""
     if isinstance(data, dict) and "data" in data:
         data = data["data"]
 
     if not isinstance(data, list):
         logger.warning(f"Unexpected closed positions response format: {type(data)}")
+        return None
+
+    if not data:
         return []
 
-    for item in data:
-        try:
-            positions.append(_parse_closed_position(item))
-        except Exception as e:
-            logger.warning(f"Failed to parse closed position: {e}")
-            continue
+    rows = [
+        row
+        for item in data
+        if (row := _safe_parse(_closed_position_fields, item, "closed position")) is not None
+    ]
+
+    return _validate_rows(_CLOSED_POSITIONS_ADAPTER, ClosedPosition, rows)
 
-    return positions
 
+def _safe_parse(parse: Callable[[dict], dict], item: dict, kind: str) -> dict | None:
+    """Run a field parser on one record, logging and returning None on failure."""
+    try:
+        return parse(item)
+    except Exception as e:
+        logger.warning(f"Failed to parse {kind}: {e}")
+        return None
+
+
+def _validate_rows(adapter: TypeAdapter, model: type[BaseModel], rows: list[dict]) -> list:
+    """
+    Build models from coerced field dicts in a single validation call.
+
+    Falls back to per-row construction if any row fails, so one bad record
+    only drops itself rather than the whole response.
+
+    Args:
+        adapter: TypeAdapter for list[model]
+        model: Model class
+        rows: Field dicts from the _*_fields helpers
 
-def _parse_holder(data: dict) -> Holder:
-    """Parse holder from API response."""
+    Returns:
+        List of model instances
+    """
+    try:
+        return adapter.validate_python(rows)
+    except ValidationError:
+        records = []
+        for row in rows:
+            try:
+                records.append(model(**row))
+            except ValidationError as e:
+                logger.warning(f"Failed to parse {model.__name__}: {e}")
+                continue
+        return records
+
+
+def _holder_fields(data: dict) -> dict:
+    """Extract Holder fields from an API record."""
     # Address can be in multiple fields
     address = (
         data.get("proxyWallet")
@@ -201,22 +536,22 @@ def _parse_holder(data: dict) -> Holder:
         or 0.0
     )
 
-    return Holder(
-        address=address,
-        username=username,
-        outcome_index=int(outcome_index),
-        amount_usd=float(amount_usd),
-    )
+    return {
+        "address": address,
+        "username": username,
+        "outcome_index": int(outcome_index),
+        "amount_usd": float(amount_usd),
+    }
 
 
-def _parse_trade(data: dict) -> Trade:
-    """Parse trade from API response."""
+def _trade_fields(data: dict) -> dict:
+    """Extract Trade fields from an API record."""
     # Timestamp
     ts_raw = data.get("timestamp") or data.get("ts") or data.get("time")
     if ts_raw:
-        ts = parse_datetime(ts_raw)
+        ts_ns = parse_timestamp_ns(ts_raw)
     else:
-        ts = datetime.now()
+        ts_ns = time.time_ns()
 
     # Side
     side = data.get("side") or data.get("type") or "buy"
@@ -233,18 +568,18 @@ def _parse_trade(data: dict) -> Trade:
     # Market
     market = data.get("market") or data.get("condition_id")
 
-    return Trade(
-        ts=ts,
-        side=str(side),
-        price=float(price),
-        amount=float(amount),
-        amount_usd=float(amount_usd),
-        market=market,
-    )
+    return {
+        "ts_ns": ts_ns,
+        "side": str(side),
+        "price": float(price),
+        "amount": float(amount),
+        "amount_usd": float(amount_usd),
+        "market": market,
+    }
 
 
-def _parse_closed_position(data: dict) -> ClosedPosition:
-    """Parse closed position from API response."""
+def _closed_position_fields(data: dict) -> dict:
+    """Extract ClosedPosition fields from an API record."""
     # Title
     title = data.get("title") or data.get("marketTitle") or data.get("question") or ""
 
@@ -260,18 +595,23 @@ def _parse_closed_position(data: dict) -> ClosedPosition:
     # Resolved at
     resolved_at_raw = data.get("resolvedAt") or data.get("resolved_at") or data.get("closedAt")
     if resolved_at_raw:
-        resolved_at = parse_datetime(resolved_at_raw)
+        resolved_at_ns = parse_timestamp_ns(resolved_at_raw)
     else:
-        resolved_at = datetime.now()
+        resolved_at_ns = time.time_ns()
 
     # Amount risked
-    amount_risked = data.get("amountRisked") or data.get("amount_risked") or data.get("investment")
-
-    return ClosedPosition(
-        title=title,
-        event_id=event_id,
-        pnl_usd=float(pnl_usd),
-        was_winner=bool(was_winner),
-        resolved_at=resolved_at,
-        amount_risked=float(amount_risked) if amount_risked else None,
-    )
+    # Use explicit None checks so a real amountRisked of 0 is kept rather than treated as missing
+    amount_risked = data.get("amountRisked")
+    if amount_risked is None:
+        amount_risked = data.get("amount_risked")
+    if amount_risked is None:
+        amount_risked = data.get("investment")
+
+    return {
+        "title": title,
+        "event_id": event_id,
+        "pnl_usd": float(pnl_usd),
+        "was_winner": bool(was_winner),
+        "resolved_at_ns": resolved_at_ns,
+        "amount_risked": float(amount_risked) if amount_risked is not None else None,
+    }
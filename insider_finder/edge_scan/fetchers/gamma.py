@@ -5,6 +5,7 @@ Resolves market slug or condition ID to full market details.
 """
 
 import logging
+import re
 
 from ..models import Market
 from ..utils import http_get, parse_datetime
@@ -13,6 +14,12 @@ logger = logging.getLogger(__name__)
 
 GAMMA_BASE_URL = "https://gamma-api.polymarket.com"
 
+# Pattern to match /event/SLUG or /market/SLUG
+_SLUG_RE = re.compile(r"(?:event|market)/([a-zA-Z0-9\-]+)")
+
+# Condition IDs are 32-byte hex strings
+_CONDITION_ID_RE = re.compile(r"0x[0-9a-fA-F]{64}")
+
 
 def get_market_by_slug(slug: str) -> Market:
     """
@@ -147,15 +154,10 @@ def extract_slug_from_url(url: str) -> str:
         >>> extract_slug_from_url("polymarket.com/event/my-market")
         'my-market'
     """
-    import re
-
     # Remove protocol if present
     url = url.replace("https://", "").replace("http://", "")
 
-    # Pattern to match /event/SLUG or /market/SLUG
-    pattern = r"(?:event|market)/([a-zA-Z0-9\-]+)"
-    match = re.search(pattern, url)
-
+    match = _SLUG_RE.search(url)
     if match:
         return match.group(1)
 
@@ -166,7 +168,9 @@ def resolve_market(market_input: str) -> Market:
     """
     Resolve market from URL, slug, or condition ID.
 
-    Tries URL extraction first, then slug, then condition ID.
+    The input format is sniffed up front so only one lookup is made:
+    0x-prefixed 64-hex-digit strings are condition IDs, anything containing
+    a slash or polymarket.com is a URL, and everything else is a slug.
 
     Args:
         market_input: Polymarket URL, market slug, or condition ID
@@ -175,28 +179,15 @@ def resolve_market(market_input: str) -> Market:
         Market object
 
     Raises:
-        ValueError: If market cannot be resolved
+        ValueError: If no slug can be extracted or no market matches
+        httpx.HTTPError: If the API request fails
     """
-    # Check if it's a URL (contains polymarket.com or starts with http)
-    if "polymarket.com" in market_input or market_input.startswith("http"):
-        try:
-            slug = extract_slug_from_url(market_input)
-            logger.info(f"Extracted slug from URL: {slug}")
-            return get_market_by_slug(slug)
-        except Exception as e:
-            logger.debug(f"Failed to extract/resolve from URL: {e}")
-
-    # Try as slug first (slugs typically have hyphens)
-    if "-" in market_input:
-        try:
-            return get_market_by_slug(market_input)
-        except Exception as e:
-            logger.debug(f"Failed to resolve as slug: {e}")
-
-    # Try as condition ID
-    try:
+    if _CONDITION_ID_RE.fullmatch(market_input):
         return get_market_by_condition_id(market_input)
-    except Exception as e:
-        logger.debug(f"Failed to resolve as condition_id: {e}")
 
-    raise ValueError(f"Unable to resolve market: {market_input}")
+    if "/" in market_input or "polymarket.com" in market_input:
+        slug = extract_slug_from_url(market_input)
+        logger.info(f"Extracted slug from URL: {slug}")
+        return get_market_by_slug(slug)
+
+    return get_market_by_slug(market_input)
@@ -1,29 +1,199 @@
 """
-Subgraph fetcher (fallback for complete holder enumeration).
+Subgraph fetcher (fallback for holders beyond the Data API cap).
 
-Currently a stub - would query Goldsky subgraph for userPositions.
+Queries Polymarket's PnL subgraph on Goldsky for userPositions, either the
+largest holders of each outcome token or every holder of a market, in pages
+of up to 1000 positions per GraphQL request instead of the Data API's
+per-token holder cap.
 """
 
 import logging
 
-from ..models import Holder
+from ..models import Holder, Market
+from ..utils import http_post_json
 
 logger = logging.getLogger(__name__)
 
+PNL_SUBGRAPH_URL = (
+    "https://api.goldsky.com/api/public/project_cl6mb8i9h0003e201j6li0diw"
+    "/subgraphs/pnl-subgraph/0.0.14/gn"
+)
 
-def get_all_holders_subgraph(condition_id: str) -> list[Holder]:
+# Maximum page size accepted by The Graph
+SUBGRAPH_PAGE_SIZE = 1000
+
+# Share amounts are fixed-point with 6 decimals
+_FIXED_POINT_SCALE = 1e6
+
+_USER_POSITIONS_QUERY = """
+query Holders($tokenIds: [BigInt!]!, $lastId: ID!, $first: Int!) {
+  userPositions(
+    first: $first
+    orderBy: id
+    orderDirection: asc
+    where: {tokenId_in: $tokenIds, amount_gt: 0, id_gt: $lastId}
+  ) {
+    id
+    user
+    tokenId
+    amount
+  }
+}
+"""
+
+_TOP_POSITIONS_QUERY = """
+query TopHolders($tokenId: BigInt!, $first: Int!, $skip: Int!) {
+  userPositions(
+    first: $first
+    skip: $skip
+    orderBy: amount
+    orderDirection: desc
+    where: {tokenId: $tokenId, amount_gt: 0}
+  ) {
+    id
+    user
+    tokenId
+    amount
+  }
+}
+"""
+
+
+def get_top_holders_subgraph(
+    market: Market, limit: int, page_size: int = SUBGRAPH_PAGE_SIZE
+) -> list[Holder]:
     """
-    Fetch all holders via subgraph (fallback).
+    Fetch the largest holders of each outcome token via subgraph.
+
+    Orders by amount on the server, so up to ``page_size`` holders per
+    outcome cost a single query.
 
     Args:
-        condition_id: Market condition ID
+        market: Target market (needs yes/no token IDs)
+        limit: Maximum number of holders per outcome token
+        page_size: Positions requested per query
 
     Returns:
-        List of Holder objects
+        List of Holder objects, largest first within each outcome; amount_usd
+        is the share count, the same unit as the Data API's holder ``amount``
+    """
+    outcome_by_token = _outcome_by_token(market)
+    if not outcome_by_token:
+        return []
+
+    holders = []
+    for token_id in outcome_by_token:
+        fetched = 0
+        while fetched < limit:
+            first = min(page_size, limit - fetched)
+            payload = {
+                "query": _TOP_POSITIONS_QUERY,
+                "variables": {"tokenId": token_id, "first": first, "skip": fetched},
+            }
+            positions = _query_positions(payload)
+            if positions is None:
+                return []
+
+            holders.extend(_parse_user_positions(positions, outcome_by_token))
+            fetched += len(positions)
+            if len(positions) < first:
+                break
+
+    logger.info(f"Found {len(holders)} top holders via subgraph")
+    return holders
+
+
+def get_all_holders_subgraph(market: Market, page_size: int = SUBGRAPH_PAGE_SIZE) -> list[Holder]:
+    """
+    Fetch all holders via subgraph (fallback).
+
+    Pages with an id cursor (id_gt) rather than skip, which the subgraph
+    caps and which gets slower with depth.
+
+    Args:
+        market: Target market (needs yes/no token IDs)
+        page_size: Positions requested per query
 
-    Note:
-        This is a stub implementation. Full implementation would query
-        Goldsky subgraph with GraphQL.
+    Returns:
+        List of Holder objects; amount_usd is the share count, the same unit
+        as the Data API's holder ``amount`` field
     """
-    logger.warning("Subgraph fetcher not fully implemented, returning empty list")
-    return []
+    outcome_by_token = _outcome_by_token(market)
+    if not outcome_by_token:
+        return []
+
+    holders = []
+    last_id = ""
+
+    while True:
+        payload = {
+            "query": _USER_POSITIONS_QUERY,
+            "variables": {
+                "tokenIds": list(outcome_by_token),
+                "lastId": last_id,
+                "first": page_size,
+            },
+        }
+
+        positions = _query_positions(payload)
+        if positions is None:
+            return []
+
+        holders.extend(_parse_user_positions(positions, outcome_by_token))
+
+        if len(positions) < page_size:
+            break
+        last_id = positions[-1]["id"]
+
+    logger.info(f"Found {len(holders)} holders via subgraph")
+    return holders
+
+
+def _outcome_by_token(market: Market) -> dict[str, int]:
+    """Map the market's token IDs to outcome indices (0=NO, 1=YES)."""
+    outcome_by_token = {}
+    if market.no_token_id:
+        outcome_by_token[market.no_token_id] = 0
+    if market.yes_token_id:
+        outcome_by_token[market.yes_token_id] = 1
+
+    if not outcome_by_token:
+        logger.warning(f"No token IDs for market {market.condition_id}, cannot query subgraph")
+    return outcome_by_token
+
+
+def _query_positions(payload: dict) -> list[dict] | None:
+    """Run a userPositions query, returning None if it failed."""
+    try:
+        data = http_post_json(PNL_SUBGRAPH_URL, payload)
+    except Exception as e:
+        logger.error(f"Failed to query subgraph: {e}")
+        return None
+
+    if data.get("errors"):
+        logger.error(f"Subgraph query failed: {data['errors']}")
+        return None
+
+    return (data.get("data") or {}).get("userPositions") or []
+
+
+def _parse_user_positions(positions: list[dict], outcome_by_token: dict[str, int]) -> list[Holder]:
+    """Parse userPositions entities, skipping malformed ones."""
+    holders = []
+    for position in positions:
+        try:
+            holders.append(_parse_user_position(position, outcome_by_token))
+        except Exception as e:
+            logger.warning(f"Failed to parse subgraph position: {e}")
+            continue
+    return holders
+
+
+def _parse_user_position(data: dict, outcome_by_token: dict[str, int]) -> Holder:
+    """Parse a userPositions entity into a Holder, sized in shares like the Data API."""
+    return Holder(
+        address=data["user"],
+        username=None,
+        outcome_index=outcome_by_token[str(data["tokenId"])],
+        amount_usd=int(data["amount"]) / _FIXED_POINT_SCALE,
+    )
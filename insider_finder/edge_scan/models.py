@@ -1,12 +1,16 @@
 """
 Pydantic models for Polymarket API responses.
 
-Models include validation and convenience methods for conversion.
+Models include validation and convenience methods for conversion. Per-record
+models are frozen: they are built once by the fetchers/scoring and never mutated.
 """
 
 from datetime import datetime
+from operator import itemgetter
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+from .utils import ns_to_datetime
 
 
 class Market(BaseModel):
@@ -19,7 +23,7 @@ class Market(BaseModel):
     no_token_id: str | None = Field(None, description="NO outcome token ID")
     slug: str | None = Field(None, description="Market slug")
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(frozen=True)
 
 
 class Holder(BaseModel):
@@ -30,20 +34,25 @@ class Holder(BaseModel):
     outcome_index: int = Field(..., description="Outcome index (0=NO, 1=YES typically)")
     amount_usd: float = Field(..., description="Position size in USD")
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(frozen=True)
 
 
 class Trade(BaseModel):
     """Individual trade record."""
 
-    ts: datetime = Field(..., description="Trade timestamp (UTC)")
+    ts_ns: int = Field(..., description="Trade timestamp (UTC), Unix nanoseconds")
     side: str = Field(..., description="Trade side (buy/sell or YES/NO)")
     price: float = Field(..., description="Trade price")
     amount: float = Field(..., description="Trade amount in shares")
     amount_usd: float = Field(..., description="Trade amount in USD")
     market: str | None = Field(None, description="Market identifier")
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(frozen=True)
+
+    @property
+    def ts(self) -> datetime:
+        """Trade timestamp as a UTC datetime, built on access."""
+        return ns_to_datetime(self.ts_ns)
 
 
 class ClosedPosition(BaseModel):
@@ -53,10 +62,20 @@ class ClosedPosition(BaseModel):
     event_id: str | None = Field(None, description="Event ID if available")
     pnl_usd: float = Field(..., description="Realized PnL in USD")
     was_winner: bool = Field(..., description="Whether position was on winning side")
-    resolved_at: datetime = Field(..., description="Resolution timestamp (UTC)")
+    resolved_at_ns: int = Field(..., description="Resolution timestamp (UTC), Unix nanoseconds")
     amount_risked: float | None = Field(None, description="Amount risked in USD")
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(frozen=True)
+
+    @property
+    def resolved_at(self) -> datetime:
+        """Resolution timestamp as a UTC datetime, built on access."""
+        return ns_to_datetime(self.resolved_at_ns)
+
+    @property
+    def risked_amount(self) -> float:
+        """Absolute USD at risk, falling back to PnL only when amount_risked is unknown."""
+        return abs(self.amount_risked if self.amount_risked is not None else self.pnl_usd)
 
 
 class OrderBook(BaseModel):
@@ -72,15 +91,22 @@ class OrderBook(BaseModel):
     mid_price: float | None = Field(None, description="Calculated mid price")
     spread: float | None = Field(None, description="Bid-ask spread")
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(frozen=True)
+
+    @model_validator(mode="after")
+    def _sort_levels(self) -> "OrderBook":
+        """Keep best prices first: bids descending, asks ascending."""
+        # Books usually arrive already ordered (either direction), which
+        # timsort handles in a single linear pass
+        self.bids.sort(key=itemgetter(0), reverse=True)
+        self.asks.sort(key=itemgetter(0))
+        return self
 
     def calculate_mid(self) -> float | None:
         """Calculate mid price from top of book."""
         if not self.bids or not self.asks:
             return None
-        best_bid = max(self.bids, key=lambda x: x[0])[0]
-        best_ask = min(self.asks, key=lambda x: x[0])[0]
-        return (best_bid + best_ask) / 2
+        return (self.bids[0][0] + self.asks[0][0]) / 2
 
 
 class FeatureVector(BaseModel):
@@ -92,7 +118,7 @@ class FeatureVector(BaseModel):
     conviction_z: float = Field(..., description="Conviction Z-score normalized [0,1]")
     consistency: float = Field(..., description="Directional consistency score [0,1]")
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(frozen=True)
 
 
 class WalletScore(BaseModel):
@@ -102,6 +128,7 @@ class WalletScore(BaseModel):
     username: str | None = Field(None, description="Username if available")
     current_stake_usd: float = Field(..., description="Current position size USD")
     current_side: str = Field(..., description="Current side (YES/NO)")
+    side_sign: int = Field(..., description="+1 for YES, -1 for NO")
     features: FeatureVector = Field(..., description="Computed features")
     insider_likelihood_score: float = Field(
         ..., description="Overall edge likelihood score [0,1]"
@@ -114,7 +141,7 @@ class WalletScore(BaseModel):
         False, description="True if below min_sample threshold"
     )
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(frozen=True)
 
 
 class MarketSignal(BaseModel):
@@ -127,8 +154,6 @@ class MarketSignal(BaseModel):
     top_wallets_count: int = Field(..., description="Number of wallets included")
     total_stake_usd: float = Field(..., description="Total stake analyzed USD")
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 class RunMetadata(BaseModel):
     """Metadata for a complete run."""
@@ -141,5 +166,3 @@ class RunMetadata(BaseModel):
     holders_analyzed: int = Field(..., description="Number of holders analyzed")
     holders_scored: int = Field(..., description="Number with full scores")
     holders_low_sample: int = Field(..., description="Number with low sample flag")
-
-    model_config = ConfigDict(from_attributes=True)
@@ -6,6 +6,9 @@ Computes behavioral edge scores and aggregates market signals.
 
 import logging
 
+import numpy as np
+
+from ._kernels import HAS_NUMBA, compute_holder_signal, compute_insider_scores
 from .config import Config
 from .models import FeatureVector, MarketSignal, WalletScore
 from .utils import clip
@@ -52,30 +55,59 @@ def compute_wallet_scores(
     Returns:
         List of WalletScore objects
     """
-    scores = []
+    n = len(wallets_data)
+    if n == 0:
+        return []
 
-    for address, username, stake_usd, side, features, sample_size in wallets_data:
-        # Compute insider likelihood score
-        ils = compute_insider_likelihood_score(features, cfg)
+    # Weighted sum for all wallets at once over an (n, 5) feature matrix. Summing
+    # the products row-wise keeps the scalar summation order (unlike BLAS matmul),
+    # so scores are bit-identical to compute_insider_likelihood_score
+    w = cfg.weights.normalize()
+    weights = np.array(
+        [w.win_rate, w.pnl_per_usd, w.timing_edge, w.conviction_z, w.consistency],
+        dtype=np.float64,
+    )
+    features = np.array(
+        [
+            (f.win_rate, f.pnl_per_usd, f.timing_edge, f.conviction_z, f.consistency)
+            for _, _, _, _, f, _ in wallets_data
+        ],
+        dtype=np.float64,
+    )
+    if HAS_NUMBA:
+        ils = compute_insider_scores(
+            features, weights, cfg.scoring.score_floor, cfg.scoring.score_ceiling
+        )
+    else:
+        ils = np.clip(
+            (features * weights).sum(axis=1), cfg.scoring.score_floor, cfg.scoring.score_ceiling
+        )
 
-        # Determine signed contribution
-        side_sign = 1.0 if side == "YES" else -1.0
-        signed_contribution = ils * stake_usd * side_sign
+    # Signed contribution: positive for YES holders, negative for NO
+    stake = np.fromiter((d[2] for d in wallets_data), dtype=np.float64, count=n)
+    side_sign = np.where([d[3] == "YES" for d in wallets_data], 1, -1)
+    signed = ils * stake * side_sign
 
-        # Flag low sample
-        low_sample = sample_size < cfg.history.min_sample
+    # Flag low sample
+    sample_size = np.fromiter((d[5] for d in wallets_data), dtype=np.int64, count=n)
+    low_sample = sample_size < cfg.history.min_sample
 
+    scores = []
+    for (address, username, stake_usd, side, feat, samples), sign, score, contribution, low in zip(
+        wallets_data, side_sign.tolist(), ils.tolist(), signed.tolist(), low_sample.tolist()
+    ):
         scores.append(
             WalletScore(
                 address=address,
                 username=username,
                 current_stake_usd=stake_usd,
                 current_side=side,
-                features=features,
-                insider_likelihood_score=ils,
-                signed_contribution=signed_contribution,
-                sample_size=sample_size,
-                low_sample_flag=low_sample,
+                side_sign=sign,
+                features=feat,
+                insider_likelihood_score=score,
+                signed_contribution=contribution,
+                sample_size=samples,
+                low_sample_flag=low,
             )
         )
 
@@ -108,23 +140,25 @@ def compute_market_signal(
             total_stake_usd=0.0,
         )
 
-    # Compute holder signal
-    total_stake = sum(w.current_stake_usd for w in wallet_scores)
+    # Compute holder signal in one vectorized pass over the wallets
+    n = len(wallet_scores)
+    stake = np.fromiter((w.current_stake_usd for w in wallet_scores), dtype=np.float64, count=n)
+    ils = np.fromiter(
+        (w.insider_likelihood_score for w in wallet_scores), dtype=np.float64, count=n
+    )
+    side_sign = np.fromiter((w.side_sign for w in wallet_scores), dtype=np.float64, count=n)
+    cap = cfg.caps.max_influence_single_wallet
 
-    if total_stake == 0:
-        holder_signal = 0.0
+    if HAS_NUMBA:
+        holder_signal, total_stake = compute_holder_signal(ils, stake, side_sign, cap)
     else:
-        # Normalize contributions by total stake
-        contributions = []
-        for w in wallet_scores:
-            # Cap single wallet influence
-            weight = min(
-                w.current_stake_usd / total_stake,
-                cfg.caps.max_influence_single_wallet,
-            )
-            contributions.append(w.insider_likelihood_score * weight * (1 if w.current_side == "YES" else -1))
-
-        holder_signal = sum(contributions)
+        total_stake = float(stake.sum())
+        if total_stake == 0:
+            holder_signal = 0.0
+        else:
+            # Normalize by total stake, capping single wallet influence
+            weight = np.minimum(stake / total_stake, cap)
+            holder_signal = float((ils * weight * side_sign).sum())
 
     # Clip to [-1, 1]
     holder_signal = clip(holder_signal, -1.0, 1.0)
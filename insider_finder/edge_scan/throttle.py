@@ -0,0 +1,144 @@
+"""
+Adaptive (AIMD) concurrency control for outbound API requests.
+
+Grows the number of in-flight requests additively while the API is healthy
+and cuts it multiplicatively on 429/5xx responses or when the rate-limit
+headers report the budget is nearly spent, like TCP congestion control.
+"""
+
+import asyncio
+import logging
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+class Throttler:
+    """AIMD limiter on concurrent requests, used as an async context manager."""
+
+    def __init__(
+        self,
+        initial: int = 8,
+        c_min: int = 2,
+        c_max: int = 64,
+        alpha: float = 1.0,
+        beta: float = 0.5,
+        low_remaining_ratio: float = 0.1,
+        max_pause: float = 30.0,
+    ) -> None:
+        """
+        Create a throttler.
+
+        Args:
+            initial: Starting concurrency
+            c_min: Lower bound on concurrency
+            c_max: Upper bound on concurrency
+            alpha: Additive increase per full window of successful responses
+            beta: Multiplicative decrease factor on congestion signals
+            low_remaining_ratio: Back off when remaining/limit rate budget drops below this
+            max_pause: Longest Retry-After pause honoured, in seconds
+
+        Raises:
+            ValueError: Unless 1 <= c_min <= c_max and initial >= 1 (a limit
+                of 0 would block every request forever)
+        """
+        if not 1 <= c_min <= c_max:
+            raise ValueError(f"Need 1 <= c_min <= c_max, got c_min={c_min}, c_max={c_max}")
+        if initial < 1:
+            raise ValueError(f"initial concurrency must be at least 1, got {initial}")
+
+        self.c_min = c_min
+        self.c_max = c_max
+        self.alpha = alpha
+        self.beta = beta
+        self.low_remaining_ratio = low_remaining_ratio
+        self.max_pause = max_pause
+        self.limit = float(min(max(initial, c_min), c_max))
+
+        self._in_flight = 0
+        self._resume_at = 0.0
+        self._cond = asyncio.Condition()
+
+    @property
+    def concurrency(self) -> int:
+        """Current number of requests allowed in flight."""
+        return int(self.limit)
+
+    async def __aenter__(self) -> "Throttler":
+        loop = asyncio.get_running_loop()
+
+        # Honour a server-requested pause before taking a slot
+        delay = self._resume_at - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._in_flight < self.concurrency)
+            self._in_flight += 1
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        async with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+
+    def record(self, response: httpx.Response) -> None:
+        """
+        Adjust concurrency from a response's status and rate-limit headers.
+
+        Args:
+            response: Completed response (headers are enough)
+        """
+        status = response.status_code
+        if status == 429 or status >= 500 or self._budget_low(response.headers):
+            previous = self.concurrency
+            self.limit = max(float(self.c_min), self.limit * self.beta)
+
+            retry_after = parse_retry_after(response.headers.get("retry-after"))
+            if retry_after:
+                loop = asyncio.get_running_loop()
+                pause = min(retry_after, self.max_pause)
+                self._resume_at = max(self._resume_at, loop.time() + pause)
+
+            if self.concurrency != previous:
+                logger.debug("Throttling down: concurrency %d -> %d", previous, self.concurrency)
+        else:
+            # Additive increase of alpha per window of `limit` responses
+            self.limit = min(float(self.c_max), self.limit + self.alpha / self.limit)
+
+    def _budget_low(self, headers: httpx.Headers) -> bool:
+        """Whether x-ratelimit headers report less than the low-water fraction left."""
+        try:
+            remaining = float(headers["x-ratelimit-remaining"])
+            limit = float(headers["x-ratelimit-limit"])
+        except (KeyError, ValueError):
+            return False
+        return limit > 0 and remaining / limit < self.low_remaining_ratio
+
+
+class ThrottledTransport(httpx.AsyncBaseTransport):
+    """Transport wrapper that gates every request through a Throttler."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, throttler: Throttler) -> None:
+        self._transport = transport
+        self.throttler = throttler
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        async with self.throttler:
+            response = await self._transport.handle_async_request(request)
+        self.throttler.record(response)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header given in seconds (HTTP-date form is ignored)."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        return None
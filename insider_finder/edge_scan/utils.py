@@ -2,25 +2,103 @@
 Utility functions for HTTP requests, retries, logging, and data transformations.
 """
 
+import asyncio
+import atexit
+import json
 import logging
+import math
 import random
 import time
-from datetime import datetime, timezone
-from functools import wraps
-from typing import Any, Callable, TypeVar
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache, wraps
+from typing import Any, Awaitable, Callable, TypeVar
 
 import httpx
+import numpy as np
+
+from . import __version__
+from .cache import ResponseCache
+from .throttle import ThrottledTransport, Throttler, parse_retry_after
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Connection pool sizing (shared across all hosts)
+HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+
+# httpx already advertises the encodings it can decode (gzip, deflate, br if installed)
+DEFAULT_HEADERS = {"User-Agent": f"edge-scan/{__version__}"}
+
+# Shared sync client so connections (TCP + TLS) are reused across requests
+_client: httpx.Client | None = None
+
+# Optional on-disk response cache consulted by http_get / http_get_async
+_response_cache: ResponseCache | None = None
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_NS_PER_SECOND = 1_000_000_000
+
+# Unix seconds accepted by datetime (years 1-9999), so numeric timestamps fail
+# the same way on the nanosecond fast path as in parse_datetime
+_MIN_UNIX_SECONDS = -62135596800
+_MAX_UNIX_SECONDS = 253402300799
+
+# Errors worth retrying: HTTP failures plus truncated/garbled bodies, which the
+# APIs occasionally serve with a 200 during incidents
+RETRYABLE_ERRORS: tuple[type[Exception], ...] = (
+    httpx.HTTPStatusError,
+    httpx.RequestError,
+    json.JSONDecodeError,
+)
+
+# Fallback strptime formats for strings fromisoformat rejects
+_DATETIME_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d",
+)
+
+
+def _backoff_schedule(max_attempts: int, base_delay: float, max_delay: float) -> tuple[float, ...]:
+    """
+    Exponential backoff delays (before jitter) for each retry a decorator may make.
+
+    Args:
+        max_attempts: Maximum number of attempts
+        base_delay: Base delay in seconds
+        max_delay: Maximum delay in seconds
+
+    Returns:
+        Delay in seconds after each failed attempt but the last
+    """
+    return tuple(min(base_delay * (1 << attempt), max_delay) for attempt in range(max_attempts - 1))
+
+
+def _jittered(delay: float) -> float:
+    """Scale a backoff delay by a random factor in [0.5, 1.5)."""
+    return delay * (0.5 + random.random())
+
+
+def _server_retry_after(error: Exception) -> float:
+    """Seconds a 429/503 response asked clients to wait via Retry-After (0 if absent)."""
+    if isinstance(error, httpx.HTTPStatusError) and error.response.status_code in (429, 503):
+        return parse_retry_after(error.response.headers.get("retry-after")) or 0.0
+    return 0.0
+
 
 def with_retry(
     max_attempts: int = 3,
     base_delay: float = 1.0,
     max_delay: float = 30.0,
     jitter: bool = True,
+    respect_retry_after: bool = True,
+    retry_on: tuple[type[Exception], ...] = RETRYABLE_ERRORS,
 ) -> Callable[[Callable[..., T]], Callable[..., T]]:
     """
     Decorator to retry HTTP requests with exponential backoff and jitter.
@@ -30,50 +108,102 @@ def with_retry(
         base_delay: Base delay in seconds
         max_delay: Maximum delay in seconds
         jitter: Whether to add random jitter
+        respect_retry_after: Wait at least as long as a 429/503 Retry-After header asks,
+            up to max_delay
+        retry_on: Exception types that trigger a retry (4xx other than 429 never do)
 
     Returns:
         Decorated function
     """
 
+    delays = _backoff_schedule(max_attempts, base_delay, max_delay)
+
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> T:
-            last_exception = None
-
             for attempt in range(max_attempts):
                 try:
                     return func(*args, **kwargs)
-                except (httpx.HTTPStatusError, httpx.RequestError) as e:
-                    last_exception = e
-
+                except retry_on as e:
                     # Don't retry on client errors (4xx) except 429
                     if isinstance(e, httpx.HTTPStatusError):
                         if 400 <= e.response.status_code < 500 and e.response.status_code != 429:
                             raise
 
-                    if attempt < max_attempts - 1:
-                        # Calculate delay with exponential backoff
-                        delay = min(base_delay * (2**attempt), max_delay)
+                    if attempt == max_attempts - 1:
+                        logger.error(f"Request failed after {max_attempts} attempts: {e}")
+                        raise
+
+                    delay = _jittered(delays[attempt]) if jitter else delays[attempt]
+                    if respect_retry_after:
+                        delay = max(delay, min(_server_retry_after(e), max_delay))
+                    logger.warning(
+                        f"Request failed (attempt {attempt + 1}/{max_attempts}): {e}. "
+                        f"Retrying in {delay:.2f}s..."
+                    )
+                    time.sleep(delay)
+
+            raise ValueError("max_attempts must be at least 1")
+
+        return wrapper
+
+    return decorator
 
-                        # Add jitter
-                        if jitter:
-                            delay = delay * (0.5 + random.random())
 
-                        logger.warning(
-                            f"Request failed (attempt {attempt + 1}/{max_attempts}): {e}. "
-                            f"Retrying in {delay:.2f}s..."
-                        )
-                        time.sleep(delay)
-                    else:
-                        logger.error(
-                            f"Request failed after {max_attempts} attempts: {e}"
-                        )
+def with_retry_async(
+    max_attempts: int = 3,
+    base_delay: float = 1.0,
+    max_delay: float = 30.0,
+    jitter: bool = True,
+    respect_retry_after: bool = True,
+    retry_on: tuple[type[Exception], ...] = RETRYABLE_ERRORS,
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """
+    Async variant of :func:`with_retry` for coroutine functions.
 
-            # Raise the last exception if all retries failed
-            if last_exception:
-                raise last_exception
+    Backs off with ``asyncio.sleep`` so other in-flight requests keep running.
 
-            raise RuntimeError("Unexpected error in retry logic")
+    Args:
+        max_attempts: Maximum number of retry attempts
+        base_delay: Base delay in seconds
+        max_delay: Maximum delay in seconds
+        jitter: Whether to add random jitter
+        respect_retry_after: Wait at least as long as a 429/503 Retry-After header asks,
+            up to max_delay
+        retry_on: Exception types that trigger a retry (4xx other than 429 never do)
+
+    Returns:
+        Decorated coroutine function
+    """
+
+    delays = _backoff_schedule(max_attempts, base_delay, max_delay)
+
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        @wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            for attempt in range(max_attempts):
+                try:
+                    return await func(*args, **kwargs)
+                except retry_on as e:
+                    # Don't retry on client errors (4xx) except 429
+                    if isinstance(e, httpx.HTTPStatusError):
+                        if 400 <= e.response.status_code < 500 and e.response.status_code != 429:
+                            raise
+
+                    if attempt == max_attempts - 1:
+                        logger.error(f"Request failed after {max_attempts} attempts: {e}")
+                        raise
+
+                    delay = _jittered(delays[attempt]) if jitter else delays[attempt]
+                    if respect_retry_after:
+                        delay = max(delay, min(_server_retry_after(e), max_delay))
+                    logger.warning(
+                        f"Request failed (attempt {attempt + 1}/{max_attempts}): {e}. "
+                        f"Retrying in {delay:.2f}s..."
+                    )
+                    await asyncio.sleep(delay)
+
+            raise ValueError("max_attempts must be at least 1")
 
         return wrapper
 
@@ -96,10 +226,159 @@ def http_get(url: str, params: dict | None = None, timeout: float = 30.0) -> dic
     Raises:
         httpx.HTTPStatusError: If request fails after retries
     """
-    with httpx.Client(timeout=timeout) as client:
-        response = client.get(url, params=params)
-        response.raise_for_status()
-        return response.json()
+    if _response_cache is not None:
+        cached = _response_cache.get(url, params)
+        if cached is not None:
+            return decode_json(cached)
+
+    response = _get_client().get(url, params=params, timeout=timeout)
+    response.raise_for_status()
+    data = decode_json(response.content)
+
+    if _response_cache is not None:
+        _response_cache.set(url, params, response.content)
+
+    return data
+
+
+@with_retry(max_attempts=3)
+def http_post_json(url: str, payload: dict, timeout: float = 30.0) -> dict:
+    """
+    POST a JSON body with retry logic (e.g. a GraphQL query). Not cached.
+
+    Args:
+        url: URL to request
+        payload: JSON-serializable request body
+        timeout: Request timeout in seconds
+
+    Returns:
+        JSON response as dictionary
+
+    Raises:
+        httpx.HTTPStatusError: If request fails after retries
+    """
+    response = _get_client().post(url, json=payload, timeout=timeout)
+    response.raise_for_status()
+    return decode_json(response.content)
+
+
+def decode_json(content: bytes) -> Any:
+    """
+    Decode a JSON response body, using orjson when installed.
+
+    Args:
+        content: Raw response bytes
+
+    Returns:
+        Decoded JSON value
+
+    Raises:
+        json.JSONDecodeError: If the body is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _get_client() -> httpx.Client:
+    """Return the shared sync client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = httpx.Client(http2=True, headers=DEFAULT_HEADERS, limits=HTTP_LIMITS)
+    return _client
+
+
+def set_response_cache(cache: ResponseCache | None) -> None:
+    """
+    Enable (or disable with None) the on-disk response cache for all fetches.
+
+    Args:
+        cache: Cache to consult before, and fill after, each GET request
+    """
+    global _response_cache
+    _response_cache = cache
+
+
+def close_session() -> None:
+    """Close the shared sync client and response cache. Safe to call more than once."""
+    global _client, _response_cache
+    if _client is not None:
+        _client.close()
+        _client = None
+    if _response_cache is not None:
+        _response_cache.close()
+        _response_cache = None
+
+
+# Release pooled connections and the cache handle for callers that never close them
+atexit.register(close_session)
+
+
+def async_client(timeout: float = 30.0, throttler: Throttler | None = None) -> httpx.AsyncClient:
+    """
+    Create an AsyncClient sized for concurrent fetches.
+
+    A single client should be shared by all coroutines in a run so that
+    connections are pooled and reused. HTTP/2 lets concurrent requests to
+    the same host share one connection instead of queueing for the pool.
+
+    Args:
+        timeout: Default request timeout in seconds
+        throttler: Optional AIMD throttler gating every request made by the client
+
+    Returns:
+        Configured httpx.AsyncClient (use as an async context manager)
+    """
+    transport = None
+    if throttler is not None:
+        transport = ThrottledTransport(
+            httpx.AsyncHTTPTransport(http2=True, limits=HTTP_LIMITS), throttler
+        )
+
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=timeout,
+        limits=HTTP_LIMITS,
+        headers=DEFAULT_HEADERS,
+        transport=transport,
+    )
+
+
+@with_retry_async(max_attempts=3)
+async def http_get_async(
+    client: httpx.AsyncClient,
+    url: str,
+    params: dict | None = None,
+    timeout: float = 30.0,
+) -> dict:
+    """
+    Make async HTTP GET request with retry logic.
+
+    Args:
+        client: Shared AsyncClient
+        url: URL to request
+        params: Query parameters
+        timeout: Request timeout in seconds
+
+    Returns:
+        JSON response as dictionary
+
+    Raises:
+        httpx.HTTPStatusError: If request fails after retries
+    """
+    if _response_cache is not None:
+        cached = _response_cache.get(url, params)
+        if cached is not None:
+            return decode_json(cached)
+
+    response = await client.get(url, params=params, timeout=timeout)
+    response.raise_for_status()
+    data = decode_json(response.content)
+
+    if _response_cache is not None:
+        _response_cache.set(url, params, response.content)
+
+    return data
 
 
 def parse_datetime(dt_str: str | int | float) -> datetime:
@@ -120,32 +399,81 @@ def parse_datetime(dt_str: str | int | float) -> datetime:
         return datetime.fromtimestamp(dt_str, tz=timezone.utc)
 
     if isinstance(dt_str, str):
-        # Try ISO format
+        return _parse_datetime_str(dt_str)
+
+    raise ValueError(f"Unable to parse datetime: {dt_str}")
+
+
+@lru_cache(maxsize=4096)
+def _parse_datetime_str(dt_str: str) -> datetime:
+    """
+    Parse a datetime string to UTC, memoized on the raw string.
+
+    Timestamps repeat heavily within and across responses (e.g. positions
+    resolved by the same market), and datetimes are immutable, so cached
+    results can be shared.
+    """
+    # Try ISO format
+    iso_str = dt_str[:-1] + "+00:00" if dt_str.endswith("Z") else dt_str
+    try:
+        dt = datetime.fromisoformat(iso_str)
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt.astimezone(timezone.utc)
+    except ValueError:
+        pass
+
+    # Try other common formats
+    for fmt in _DATETIME_FORMATS:
         try:
-            dt = datetime.fromisoformat(dt_str.replace("Z", "+00:00"))
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            return dt.astimezone(timezone.utc)
+            dt = datetime.strptime(dt_str, fmt)
+            return dt.replace(tzinfo=timezone.utc)
         except ValueError:
-            pass
-
-        # Try other common formats
-        formats = [
-            "%Y-%m-%dT%H:%M:%S",
-            "%Y-%m-%d %H:%M:%S",
-            "%Y-%m-%d",
-        ]
-
-        for fmt in formats:
-            try:
-                dt = datetime.strptime(dt_str, fmt)
-                return dt.replace(tzinfo=timezone.utc)
-            except ValueError:
-                continue
+            continue
 
     raise ValueError(f"Unable to parse datetime: {dt_str}")
 
 
+def parse_timestamp_ns(value: str | int | float) -> int:
+    """
+    Parse a timestamp to integer Unix nanoseconds (UTC).
+
+    Numeric Unix timestamps take a fast path that allocates no datetime;
+    strings are parsed with parse_datetime.
+
+    Args:
+        value: Unix timestamp in seconds (int/float) or datetime string
+
+    Returns:
+        Nanoseconds since the Unix epoch
+
+    Raises:
+        ValueError: If the timestamp cannot be parsed or is out of range
+    """
+    if isinstance(value, (int, float)):
+        if not _MIN_UNIX_SECONDS <= value <= _MAX_UNIX_SECONDS:
+            raise ValueError(f"Timestamp out of range: {value}")
+        if isinstance(value, int):
+            return value * _NS_PER_SECOND
+        # Round the fraction to microseconds exactly as datetime.fromtimestamp does
+        frac, whole = math.modf(value)
+        micros = round(frac * 1_000_000)
+        return int(whole) * _NS_PER_SECOND + micros * 1_000
+
+    return datetime_to_ns(parse_datetime(value))
+
+
+def datetime_to_ns(dt: datetime) -> int:
+    """Convert a timezone-aware datetime to integer Unix nanoseconds."""
+    delta = dt - _EPOCH
+    return (delta.days * 86_400 + delta.seconds) * _NS_PER_SECOND + delta.microseconds * 1_000
+
+
+def ns_to_datetime(ns: int) -> datetime:
+    """Convert integer Unix nanoseconds to a UTC datetime (microsecond precision)."""
+    return _EPOCH + timedelta(microseconds=ns // 1_000)
+
+
 def clip(value: float, min_val: float, max_val: float) -> float:
     """Clip value to range [min_val, max_val]."""
     return max(min_val, min(max_val, value))
@@ -169,6 +497,22 @@ def normalize_to_unit(value: float, min_val: float, max_val: float) -> float:
     return (value - min_val) / (max_val - min_val)
 
 
+def _percentile_bounds(values: np.ndarray, clip_pct: float) -> tuple[float, float]:
+    """
+    Lower/upper clip bounds at the order statistics used by robust_scale and winsorize.
+
+    Only the two order statistics are needed, so partition instead of sorting.
+    """
+    n = values.size
+    lower_idx = int(n * (1 - clip_pct) / 2)
+    upper_idx = int(n * (1 + clip_pct) / 2)
+    lower_idx = lower_idx if lower_idx < n else 0
+    upper_idx = upper_idx if upper_idx < n else n - 1
+
+    part = np.partition(values, [lower_idx, upper_idx])
+    return float(part[lower_idx]), float(part[upper_idx])
+
+
 def robust_scale(values: list[float], clip_pct: float = 0.95) -> list[float]:
     """
     Robust scaling using percentiles instead of min/max.
@@ -183,19 +527,13 @@ def robust_scale(values: list[float], clip_pct: float = 0.95) -> list[float]:
     if not values:
         return []
 
-    sorted_vals = sorted(values)
-    n = len(sorted_vals)
-
-    lower_idx = int(n * (1 - clip_pct) / 2)
-    upper_idx = int(n * (1 + clip_pct) / 2)
-
-    lower_bound = sorted_vals[lower_idx] if lower_idx < n else sorted_vals[0]
-    upper_bound = sorted_vals[upper_idx] if upper_idx < n else sorted_vals[-1]
+    arr = np.asarray(values, dtype=np.float64)
+    lower_bound, upper_bound = _percentile_bounds(arr, clip_pct)
 
     if upper_bound == lower_bound:
         return [0.5] * len(values)
 
-    return [clip((v - lower_bound) / (upper_bound - lower_bound), 0.0, 1.0) for v in values]
+    return np.clip((arr - lower_bound) / (upper_bound - lower_bound), 0.0, 1.0).tolist()
 
 
 def winsorize(values: list[float], clip_pct: float = 0.95) -> list[float]:
@@ -212,16 +550,10 @@ def winsorize(values: list[float], clip_pct: float = 0.95) -> list[float]:
     if not values:
         return []
 
-    sorted_vals = sorted(values)
-    n = len(sorted_vals)
+    arr = np.asarray(values, dtype=np.float64)
+    lower_bound, upper_bound = _percentile_bounds(arr, clip_pct)
 
-    lower_idx = int(n * (1 - clip_pct) / 2)
-    upper_idx = int(n * (1 + clip_pct) / 2)
-
-    lower_bound = sorted_vals[lower_idx] if lower_idx < n else sorted_vals[0]
-    upper_bound = sorted_vals[upper_idx] if upper_idx < n else sorted_vals[-1]
-
-    return [clip(v, lower_bound, upper_bound) for v in values]
+    return np.clip(arr, lower_bound, upper_bound).tolist()
 
 
 def shrink_to_prior(
@@ -248,6 +580,37 @@ def shrink_to_prior(
     return weight_obs * observed + weight_prior * prior
 
 
+def shrink_to_prior_array(
+    observed: np.ndarray | float,
+    prior: np.ndarray | float,
+    n_observations: np.ndarray | int,
+    n_prior: np.ndarray | int,
+) -> np.ndarray:
+    """
+    Vectorized :func:`shrink_to_prior` over arrays (arguments broadcast).
+
+    Args:
+        observed: Observed values
+        prior: Prior values
+        n_observations: Numbers of observations
+        n_prior: Effective sample sizes of the priors
+
+    Returns:
+        Shrunk values, equal to shrink_to_prior element-wise
+    """
+    observed = np.asarray(observed, dtype=np.float64)
+    prior = np.asarray(prior, dtype=np.float64)
+    n_observations = np.asarray(n_observations, dtype=np.float64)
+    n_prior = np.asarray(n_prior, dtype=np.float64)
+
+    total = n_observations + n_prior
+    no_data = total == 0
+    safe_total = np.where(no_data, 1.0, total)
+
+    shrunk = (n_observations / safe_total) * observed + (n_prior / safe_total) * prior
+    return np.where(no_data, prior, shrunk)
+
+
 def weighted_mean(values: list[float], weights: list[float]) -> float:
     """
     Calculate weighted mean.
@@ -268,8 +631,11 @@ def weighted_mean(values: list[float], weights: list[float]) -> float:
     if not values:
         return 0.0
 
-    total_weight = sum(weights)
+    v = np.asarray(values, dtype=np.float64)
+    w = np.asarray(weights, dtype=np.float64)
+
+    total_weight = w.sum()
     if total_weight == 0:
         raise ValueError("Weights sum to zero")
 
-    return sum(v * w for v, w in zip(values, weights)) / total_weight
+    return float(v @ w / total_weight)
@@ -0,0 +1,90 @@
+"""Tests for the on-disk response cache."""
+
+import time
+
+import pytest
+
+from edge_scan.cache import ResponseCache
+
+URL = "https://data-api.polymarket.com/trades"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ResponseCache(tmp_path / "cache.sqlite", default_ttl=60.0, endpoint_ttls={})
+    yield cache
+    cache.close()
+
+
+def test_hit_is_independent_of_param_order(cache):
+    cache.set(URL, {"user": "0xabc", "limit": 500}, b"[1]")
+
+    assert cache.get(URL, {"limit": 500, "user": "0xabc"}) == b"[1]"
+    assert cache.get(URL, {"limit": 100, "user": "0xabc"}) is None
+
+
+def test_entries_expire_after_ttl(cache, monkeypatch):
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now)
+    cache.set(URL, None, b"[]")
+
+    monkeypatch.setattr(time, "time", lambda: now + 59.0)
+    assert cache.get(URL) == b"[]"
+
+    monkeypatch.setattr(time, "time", lambda: now + 61.0)
+    assert cache.get(URL) is None
+
+
+def test_endpoint_ttl_overrides(tmp_path):
+    cache = ResponseCache(
+        tmp_path / "cache.sqlite",
+        default_ttl=60.0,
+        endpoint_ttls={"*/book": 30.0, "*/closed-positions": 0.0},
+    )
+
+    assert cache.ttl_for("https://clob.polymarket.com/book") == 30.0
+    assert cache.ttl_for(URL) == 60.0
+
+    # A TTL of 0 disables caching for that endpoint
+    cache.set("https://data-api.polymarket.com/closed-positions", None, b"[]")
+    assert cache.get("https://data-api.polymarket.com/closed-positions") is None
+    cache.close()
+
+
+def test_clear_removes_everything(cache):
+    cache.set(URL, {"offset": 0}, b"[1]")
+    cache.set(URL, {"offset": 1}, b"[2]")
+
+    cache.clear()
+
+    assert cache.get(URL, {"offset": 0}) is None
+    assert cache.get(URL, {"offset": 1}) is None
+
+
+def test_batched_writes_persist_on_close(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    cache = ResponseCache(path, endpoint_ttls={}, commit_every=100)
+    cache.set(URL, None, b"[1]")
+
+    # Visible before any commit on the writing connection
+    assert cache.get(URL) == b"[1]"
+    cache.close()
+
+    reopened = ResponseCache(path, endpoint_ttls={})
+    assert reopened.get(URL) == b"[1]"
+    reopened.close()
+
+
+def test_commits_every_n_writes(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    cache = ResponseCache(path, endpoint_ttls={}, commit_every=2)
+    reader = ResponseCache(path, endpoint_ttls={})
+
+    cache.set(URL, {"offset": 0}, b"[1]")
+    assert reader.get(URL, {"offset": 0}) is None
+
+    cache.set(URL, {"offset": 1}, b"[2]")
+    assert reader.get(URL, {"offset": 0}) == b"[1]"
+
+    reader.close()
+    cache.close()
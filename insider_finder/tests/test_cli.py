@@ -0,0 +1,117 @@
+"""Tests for per-wallet history fetching in the CLI scan."""
+
+import argparse
+import asyncio
+
+import httpx
+
+from edge_scan.cli import _process_wallet
+from edge_scan.config import Config
+from edge_scan.models import Holder, Market
+
+WALLET = "0x" + "ab" * 20
+
+
+def _market() -> Market:
+    return Market(
+        condition_id="0xcond",
+        title="Will X beat earnings?",
+        end_time="2025-10-24T00:00:00Z",
+    )
+
+
+def _closed_position(amount_risked: float) -> dict:
+    return {
+        "title": "X earnings beat?",
+        "pnl": 10.0,
+        "resolvedAt": 1_700_000_000,
+        "amountRisked": amount_risked,
+    }
+
+
+def _trade() -> dict:
+    return {"proxyWallet": WALLET, "timestamp": 1_700_000_000, "price": 0.5, "size": 10}
+
+
+def _client(responses: dict[str, object]):
+    """AsyncClient over mock endpoints; ``responses`` maps path -> JSON body."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        return httpx.Response(200, json=responses[request.url.path])
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler)), requests
+
+
+def _process(client, zero_stake: bool, trades_by_wallet=None):
+    holder = Holder(address=WALLET, outcome_index=1, amount_usd=0.0 if zero_stake else 100.0)
+    args = argparse.Namespace(earnings_only=True)
+
+    async def run():
+        async with client:
+            return await _process_wallet(
+                client,
+                holder,
+                "YES",
+                zero_stake,
+                _market(),
+                trades_by_wallet,
+                args,
+                Config.default(),
+            )
+
+    return asyncio.run(run())
+
+
+def test_staked_wallet_is_scored():
+    client, requests = _client(
+        {"/closed-positions": [_closed_position(500.0)], "/trades": [_trade()]}
+    )
+
+    address, _, stake, side, _, sample_size = _process(client, zero_stake=False)
+
+    assert (address, stake, side, sample_size) == (WALLET, 100.0, "YES", 1)
+    assert sorted(requests) == ["/closed-positions", "/trades"]
+
+
+def test_failed_closed_positions_fetch_skips_wallet():
+    client, _ = _client({"/closed-positions": "unavailable", "/trades": [_trade()]})
+
+    assert _process(client, zero_stake=False) is None
+
+
+def test_failed_trades_fetch_skips_wallet():
+    client, _ = _client({"/closed-positions": [_closed_position(500.0)], "/trades": "unavailable"})
+
+    assert _process(client, zero_stake=False) is None
+
+
+def test_market_trades_are_used_instead_of_per_wallet_fetch():
+    client, requests = _client({"/closed-positions": [_closed_position(500.0)]})
+
+    assert _process(client, zero_stake=False, trades_by_wallet={}) is not None
+    assert requests == ["/closed-positions"]
+
+
+def test_zero_stake_low_activity_stops_before_trades():
+    client, requests = _client({"/closed-positions": [_closed_position(10.0)]})
+
+    assert _process(client, zero_stake=True) is None
+    assert requests == ["/closed-positions"]
+
+
+def test_zero_stake_failed_closed_positions_stops_before_trades():
+    client, requests = _client({"/closed-positions": "unavailable"})
+
+    assert _process(client, zero_stake=True) is None
+    assert requests == ["/closed-positions"]
+
+
+def test_zero_stake_active_wallet_fetches_trades_after_positions():
+    client, requests = _client(
+        {"/closed-positions": [_closed_position(500.0)], "/trades": [_trade()]}
+    )
+
+    assert _process(client, zero_stake=True) is not None
+    assert requests == ["/closed-positions", "/trades"]
@@ -0,0 +1,227 @@
+"""Tests for Data API fetching and response parsing."""
+
+import asyncio
+from datetime import datetime, timezone
+
+import httpx
+
+from edge_scan.fetchers import data_api
+from edge_scan.fetchers.data_api import (
+    _group_trades,
+    _parse_closed_positions_response,
+    aget_holders,
+    aget_market_trades_by_wallet,
+)
+from edge_scan.models import Holder, Market
+
+
+def _position(**fields):
+    return {"title": "X earnings", "pnl": 50.0, "resolvedAt": 1_700_000_000, **fields}
+
+
+def test_zero_amount_risked_is_kept():
+    (position,) = _parse_closed_positions_response([_position(amountRisked=0)])
+
+    assert position.amount_risked == 0.0
+    assert position.risked_amount == 0.0
+
+
+def test_amount_risked_falls_back_through_keys():
+    (position,) = _parse_closed_positions_response([_position(investment=20)])
+
+    assert position.amount_risked == 20.0
+    assert position.risked_amount == 20.0
+
+
+def test_missing_amount_risked_falls_back_to_pnl():
+    (position,) = _parse_closed_positions_response([_position(pnl=-50.0)])
+
+    assert position.amount_risked is None
+    assert position.risked_amount == 50.0
+
+
+def _holders_client(n_holders: int, cap: int | None = None, honour_offset: bool = True):
+    """AsyncClient over a mock /holders endpoint returning one YES token group."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        limit = int(request.url.params["limit"])
+        offset = int(request.url.params.get("offset", 0)) if honour_offset else 0
+        if cap is not None:
+            limit = min(limit, cap)
+        holders = [
+            {"proxyWallet": f"0x{i:040x}", "outcomeIndex": 1, "amount": 1.0}
+            for i in range(offset, min(offset + limit, n_holders))
+        ]
+        return httpx.Response(200, json=[{"token": "yes", "holders": holders}])
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler)), requests
+
+
+def _fetch_holders(client: httpx.AsyncClient, limit: int = 500) -> list:
+    async def run():
+        async with client:
+            return await aget_holders(client, "0xcond", limit=limit)
+
+    return asyncio.run(run())
+
+
+def test_holders_single_request_when_limit_is_served():
+    client, requests = _holders_client(n_holders=800)
+
+    assert len(_fetch_holders(client)) == 500
+    assert len(requests) == 1
+    assert requests[0].url.params["limit"] == "500"
+
+
+def test_holders_pages_when_api_caps_and_honours_offset():
+    client, requests = _holders_client(n_holders=800, cap=100)
+
+    assert len(_fetch_holders(client)) == 500
+    assert len(requests) == 5
+
+
+def test_holders_stops_after_probe_when_offset_is_ignored():
+    client, requests = _holders_client(n_holders=800, cap=100, honour_offset=False)
+
+    assert len(_fetch_holders(client)) == 100
+    assert len(requests) == 2
+
+
+def _market() -> Market:
+    return Market(
+        condition_id="0xcond",
+        title="Will X beat earnings?",
+        end_time=datetime(2025, 10, 24, tzinfo=timezone.utc),
+        yes_token_id="111",
+        no_token_id="222",
+    )
+
+
+def _subgraph_holders(n: int) -> list[Holder]:
+    return [
+        Holder(address=f"0x{i:040x}", username=None, outcome_index=1, amount_usd=float(n - i))
+        for i in range(n)
+    ]
+
+
+def _top_holders(n: int, calls: list | None = None):
+    """Stand-in for get_top_holders_subgraph over a market with ``n`` YES holders."""
+
+    def fetch(market, limit):
+        if calls is not None:
+            calls.append(limit)
+        return _subgraph_holders(n)[:limit]
+
+    return fetch
+
+
+def test_capped_holders_filled_in_from_subgraph(monkeypatch):
+    monkeypatch.setattr(data_api, "get_top_holders_subgraph", _top_holders(800))
+    client, requests = _holders_client(n_holders=800, cap=100, honour_offset=False)
+
+    holders = asyncio.run(_fetch_with_market(client, _market()))
+
+    assert len(holders) == 500
+    assert len({h.address.lower() for h in holders}) == 500
+    # The Data API's own entries come first and are kept as returned
+    assert [h.address for h in holders[:100]] == [f"0x{i:040x}" for i in range(100)]
+    assert all(h.amount_usd == 1.0 for h in holders[:100])
+
+
+def test_small_market_fallback_is_bounded_by_limit(monkeypatch):
+    calls = []
+    monkeypatch.setattr(data_api, "get_top_holders_subgraph", _top_holders(60, calls))
+    client, _ = _holders_client(n_holders=60, honour_offset=False)
+
+    holders = asyncio.run(_fetch_with_market(client, _market()))
+
+    assert len(holders) == 60
+    assert all(h.amount_usd == 1.0 for h in holders)
+    assert calls == [500]
+
+
+def test_no_subgraph_query_when_offset_works(monkeypatch):
+    def fail(market, limit):
+        raise AssertionError("subgraph should not be queried")
+
+    monkeypatch.setattr(data_api, "get_top_holders_subgraph", fail)
+    client, _ = _holders_client(n_holders=60)
+
+    assert len(asyncio.run(_fetch_with_market(client, _market()))) == 60
+
+
+async def _fetch_with_market(client: httpx.AsyncClient, market: Market) -> list:
+    async with client:
+        return await aget_holders(client, "0xcond", limit=500, market=market)
+
+
+def test_group_trades_drops_only_invalid_rows():
+    rows = [
+        {"ts_ns": 1, "side": "BUY", "price": 0.5, "amount": 10.0, "amount_usd": 5.0, "market": "m"},
+        {"ts_ns": 2, "side": "BUY", "price": "bad", "amount": 1.0, "amount_usd": 1.0, "market": "m"},
+        {"ts_ns": 3, "side": "SELL", "price": 0.4, "amount": 5.0, "amount_usd": 2.0, "market": "m"},
+        {"ts_ns": 4, "side": "BUY", "price": "bad", "amount": 1.0, "amount_usd": 1.0, "market": "m"},
+    ]
+
+    grouped = _group_trades(["0xa", "0xb", "0xa", "0xc"], rows)
+
+    assert list(grouped) == ["0xa"]
+    assert [t.ts_ns for t in grouped["0xa"]] == [1, 3]
+
+
+def _market_trades_client(n_trades: int, fail_at: int | None = None):
+    """AsyncClient over a mock market-wide /trades endpoint honouring limit and offset."""
+    offsets = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        limit = int(request.url.params["limit"])
+        offset = int(request.url.params["offset"])
+        offsets.append(offset)
+        if offset == fail_at:
+            return httpx.Response(200, json={"error": "unavailable"})
+        wallets = ["0xAAA", "0xbbb", "0xccc"]
+        trades = [
+            {"proxyWallet": wallets[i % 3], "timestamp": 1_700_000_000 + i, "price": 0.5}
+            for i in range(offset, min(offset + limit, n_trades))
+        ]
+        return httpx.Response(200, json=trades)
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler)), offsets
+
+
+def _fetch_market_trades(client, **kwargs):
+    async def run():
+        async with client:
+            return await aget_market_trades_by_wallet(client, "0xcond", **kwargs)
+
+    return asyncio.run(run())
+
+
+def test_market_trades_paged_until_empty_page():
+    client, offsets = _market_trades_client(250)
+
+    grouped = _fetch_market_trades(client, page_size=100)
+
+    assert offsets == [0, 100, 200, 250]
+    assert sorted(grouped) == ["0xaaa", "0xbbb", "0xccc"]
+    assert sum(map(len, grouped.values())) == 250
+    assert [t.ts_ns for t in grouped["0xaaa"][:2]] == [
+        1_700_000_000 * 10**9,
+        1_700_000_003 * 10**9,
+    ]
+
+
+def test_market_trades_over_max_fall_back_to_per_wallet():
+    client, offsets = _market_trades_client(1000)
+
+    assert _fetch_market_trades(client, max_trades=300, page_size=100) is None
+    assert offsets == [0, 100, 200]
+
+
+def test_market_trades_failed_page_falls_back_to_per_wallet():
+    client, offsets = _market_trades_client(250, fail_at=100)
+
+    assert _fetch_market_trades(client, page_size=100) is None
+    assert offsets == [0, 100]
@@ -0,0 +1,94 @@
+"""Tests that array and numba feature paths match the per-position scalar formulas."""
+
+import random
+
+import pytest
+
+from edge_scan import features
+from edge_scan._kernels import HAS_NUMBA
+from edge_scan.config import Config
+from edge_scan.features import compute_features
+from edge_scan.models import ClosedPosition
+from edge_scan.utils import (
+    clip,
+    normalize_to_unit,
+    shrink_to_prior,
+    weighted_mean,
+    winsorize,
+)
+
+KERNEL_PATHS = [False, pytest.param(True, marks=pytest.mark.skipif(not HAS_NUMBA, reason="numba"))]
+
+
+def _positions(n: int, rng: random.Random) -> list[ClosedPosition]:
+    return [
+        ClosedPosition(
+            title=f"Company {i} earnings beat?",
+            pnl_usd=rng.choice([0.0, rng.uniform(-500, 800)]),
+            was_winner=rng.random() < 0.5,
+            resolved_at_ns=1_700_000_000_000_000_000 + i,
+            amount_risked=rng.choice([None, 0.0, rng.uniform(1, 1000)]),
+        )
+        for i in range(n)
+    ]
+
+
+def _scalar_features(current_stake: float, positions: list[ClosedPosition], cfg: Config):
+    """Reference implementation looping over positions with the list-based helpers."""
+    prior = cfg.scoring.shrinkage_prior
+    risked = [p.risked_amount for p in positions]
+
+    if not positions or sum(risked) == 0:
+        win_rate = prior
+    else:
+        observed = weighted_mean([1.0 if p.was_winner else 0.0 for p in positions], risked)
+        shrunk = shrink_to_prior(observed, prior, len(positions), cfg.history.min_sample)
+        win_rate = clip(shrunk, 0.0, 1.0)
+
+    ratios = [p.pnl_usd / r for p, r in zip(positions, risked) if r > 0]
+    if ratios:
+        winsorized = sorted(winsorize(ratios, cfg.caps.feature_clip_pct))
+        pnl_per_usd = clip(normalize_to_unit(winsorized[len(winsorized) // 2], -0.5, 1.5), 0.0, 1.0)
+    else:
+        pnl_per_usd = 0.5
+
+    stakes = [r for r in risked if r != 0]
+    conviction_z = 0.5
+    if stakes:
+        mean = sum(stakes) / len(stakes)
+        std = (sum((s - mean) ** 2 for s in stakes) / len(stakes)) ** 0.5
+        if std != 0:
+            conviction_z = clip(normalize_to_unit((current_stake - mean) / std, -3.0, 3.0), 0.0, 1.0)
+
+    return win_rate, pnl_per_usd, conviction_z
+
+
+@pytest.mark.parametrize("use_kernel", KERNEL_PATHS)
+def test_numeric_features_match_scalar_path(monkeypatch, use_kernel):
+    monkeypatch.setattr(features, "HAS_NUMBA", use_kernel)
+    cfg = Config.default()
+    rng = random.Random(11)
+
+    for _ in range(300):
+        positions = _positions(rng.randint(0, 25), rng)
+        stake = rng.uniform(0, 2000)
+
+        feat, sample_size = compute_features("0xabc", stake, positions, [], cfg)
+        win_rate, pnl_per_usd, conviction_z = _scalar_features(stake, positions, cfg)
+
+        assert sample_size == len(positions)
+        assert feat.win_rate == pytest.approx(win_rate, rel=1e-9, abs=1e-12)
+        assert feat.pnl_per_usd == pytest.approx(pnl_per_usd, rel=1e-9, abs=1e-12)
+        assert feat.conviction_z == pytest.approx(conviction_z, rel=1e-9, abs=1e-12)
+
+
+def test_non_earnings_positions_are_ignored():
+    cfg = Config.default()
+    rng = random.Random(1)
+    positions = _positions(5, rng)
+    unrelated = [p.model_copy(update={"title": "Who wins the election?"}) for p in positions]
+
+    feat, sample_size = compute_features("0xabc", 10.0, positions + unrelated, [], cfg)
+
+    assert sample_size == len(positions)
+    assert feat == compute_features("0xabc", 10.0, positions, [], cfg)[0]
@@ -0,0 +1,65 @@
+"""Tests for model timestamp storage and order book handling."""
+
+from datetime import datetime, timezone
+
+from edge_scan.fetchers.clob import _parse_order_book
+from edge_scan.fetchers.data_api import _parse_closed_positions_response, _parse_trades_response
+from edge_scan.models import OrderBook
+
+
+def test_trade_timestamp_round_trip():
+    expected = datetime(2023, 11, 14, 22, 13, 20, 500000, tzinfo=timezone.utc)
+
+    for raw in (1_700_000_000.5, "2023-11-14T22:13:20.5Z", "2023-11-14T22:13:20.500000+00:00"):
+        (trade,) = _parse_trades_response([{"timestamp": raw, "price": 0.5, "size": 2}])
+        assert trade.ts_ns == 1_700_000_000_500_000_000
+        assert trade.ts == expected
+
+
+def test_closed_position_resolved_at_round_trip():
+    (position,) = _parse_closed_positions_response(
+        [{"title": "X earnings", "pnl": 1.0, "resolvedAt": "2024-05-01T00:00:00Z"}]
+    )
+
+    assert position.resolved_at == datetime(2024, 5, 1, tzinfo=timezone.utc)
+    assert position.resolved_at.tzinfo is not None
+
+
+def test_order_book_levels_sorted_best_first():
+    book = OrderBook(
+        token_id="y",
+        bids=[(0.40, 10.0), (0.55, 1.0), (0.50, 5.0)],
+        asks=[(0.70, 3.0), (0.60, 2.0), (0.65, 1.0)],
+    )
+
+    assert [p for p, _ in book.bids] == [0.55, 0.50, 0.40]
+    assert [p for p, _ in book.asks] == [0.60, 0.65, 0.70]
+    # Same as max(bids) / min(asks) over the unsorted levels
+    assert book.calculate_mid() == (0.55 + 0.60) / 2
+
+
+def test_order_book_mid_needs_both_sides():
+    assert OrderBook(token_id="y", bids=[(0.5, 1.0)]).calculate_mid() is None
+    assert OrderBook(token_id="y").calculate_mid() is None
+
+
+def test_parsed_order_book_uses_sorted_top_of_book():
+    book = _parse_order_book(
+        "y",
+        {
+            "bids": [{"price": "0.40", "size": "10"}, {"price": "0.55", "size": "1"}, "junk"],
+            "asks": [{"price": "0.70", "size": "3"}, {"price": "0.60", "size": "2"}],
+        },
+    )
+
+    assert book.bids == [(0.55, 1.0), (0.40, 10.0)]
+    assert book.asks == [(0.60, 2.0), (0.70, 3.0)]
+    assert book.mid_price == (0.55 + 0.60) / 2
+    assert book.spread == 0.60 - 0.55
+
+
+def test_parsed_one_sided_order_book_has_no_mid():
+    book = _parse_order_book("y", {"bids": [{"price": "0.5", "size": "1"}], "asks": []})
+
+    assert book.mid_price is None
+    assert book.spread is None
@@ -0,0 +1,111 @@
+"""Tests for the HTTP retry decorators."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from edge_scan import utils
+from edge_scan.utils import with_retry, with_retry_async
+
+REQUEST = httpx.Request("GET", "https://example.com")
+
+
+def _status_error(status: int, **headers: str) -> httpx.HTTPStatusError:
+    response = httpx.Response(status, headers=headers, request=REQUEST)
+    return httpx.HTTPStatusError(f"HTTP {status}", request=REQUEST, response=response)
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    recorded: list[float] = []
+    monkeypatch.setattr(utils.time, "sleep", recorded.append)
+    return recorded
+
+
+def _failing(errors: list[Exception], calls: list[int]):
+    def func():
+        calls.append(1)
+        if len(calls) <= len(errors):
+            raise errors[len(calls) - 1]
+        return "ok"
+
+    return func
+
+
+def test_exponential_backoff_without_jitter(sleeps):
+    calls: list[int] = []
+    func = with_retry(max_attempts=4, base_delay=1.0, max_delay=3.0, jitter=False)(
+        _failing([httpx.ConnectError("down")] * 3, calls)
+    )
+
+    assert func() == "ok"
+    assert sleeps == [1.0, 2.0, 3.0]
+
+
+def test_gives_up_and_reraises_after_max_attempts(sleeps):
+    calls: list[int] = []
+    func = with_retry(max_attempts=2, jitter=False)(
+        _failing([httpx.ConnectError("down")] * 5, calls)
+    )
+
+    with pytest.raises(httpx.ConnectError):
+        func()
+    assert len(calls) == 2
+
+
+def test_client_errors_are_not_retried(sleeps):
+    calls: list[int] = []
+    func = with_retry(max_attempts=3)(_failing([_status_error(404)], calls))
+
+    with pytest.raises(httpx.HTTPStatusError):
+        func()
+    assert len(calls) == 1 and sleeps == []
+
+
+def test_retry_after_raises_the_delay(sleeps):
+    calls: list[int] = []
+    func = with_retry(max_attempts=2, base_delay=1.0, jitter=False)(
+        _failing([_status_error(429, **{"retry-after": "5"})], calls)
+    )
+
+    assert func() == "ok"
+    assert sleeps == [5.0]
+
+
+def test_retry_after_is_capped_at_max_delay(sleeps):
+    calls: list[int] = []
+    func = with_retry(max_attempts=2, base_delay=1.0, max_delay=30.0, jitter=False)(
+        _failing([_status_error(503, **{"retry-after": "3600"})], calls)
+    )
+
+    assert func() == "ok"
+    assert sleeps == [30.0]
+
+
+def test_retry_after_ignored_when_disabled(sleeps):
+    calls: list[int] = []
+    func = with_retry(max_attempts=2, base_delay=1.0, jitter=False, respect_retry_after=False)(
+        _failing([_status_error(429, **{"retry-after": "5"})], calls)
+    )
+
+    assert func() == "ok"
+    assert sleeps == [1.0]
+
+
+def test_async_retry_caps_retry_after(monkeypatch):
+    sleeps: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    monkeypatch.setattr(utils.asyncio, "sleep", fake_sleep)
+    calls: list[int] = []
+    failing = _failing([_status_error(429, **{"retry-after": "3600"})], calls)
+
+    @with_retry_async(max_attempts=2, max_delay=10.0, jitter=False)
+    async def func():
+        return failing()
+
+    assert asyncio.run(func()) == "ok"
+    assert sleeps == [10.0]
@@ -0,0 +1,104 @@
+"""Tests that vectorized scoring matches the scalar per-wallet formulas."""
+
+import random
+
+import pytest
+
+from edge_scan import scoring
+from edge_scan._kernels import HAS_NUMBA
+from edge_scan.config import Config
+from edge_scan.models import FeatureVector
+from edge_scan.scoring import (
+    compute_insider_likelihood_score,
+    compute_market_signal,
+    compute_wallet_scores,
+)
+from edge_scan.utils import clip
+
+KERNEL_PATHS = [False, pytest.param(True, marks=pytest.mark.skipif(not HAS_NUMBA, reason="numba"))]
+
+
+def _wallets_data(n: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    return [
+        (
+            f"0x{i:040x}",
+            None,
+            rng.choice([0.0, rng.uniform(1, 5000)]),
+            rng.choice(["YES", "NO"]),
+            FeatureVector(
+                win_rate=rng.random(),
+                pnl_per_usd=rng.random(),
+                timing_edge=rng.random(),
+                conviction_z=rng.random(),
+                consistency=rng.random(),
+            ),
+            rng.randint(0, 20),
+        )
+        for i in range(n)
+    ]
+
+
+@pytest.mark.parametrize("use_kernel", KERNEL_PATHS)
+def test_wallet_scores_match_scalar_path(monkeypatch, use_kernel):
+    monkeypatch.setattr(scoring, "HAS_NUMBA", use_kernel)
+    cfg = Config.default()
+    data = _wallets_data(200)
+
+    scores = compute_wallet_scores(data, cfg)
+
+    for (address, _, stake, side, feat, samples), score in zip(data, scores):
+        ils = compute_insider_likelihood_score(feat, cfg)
+        sign = 1.0 if side == "YES" else -1.0
+        assert score.address == address
+        assert score.insider_likelihood_score == ils
+        assert score.signed_contribution == ils * stake * sign
+        assert score.side_sign == sign
+        assert score.low_sample_flag == (samples < cfg.history.min_sample)
+
+
+def test_wallet_scores_empty():
+    assert compute_wallet_scores([], Config.default()) == []
+
+
+def _scalar_holder_signal(wallet_scores, cfg):
+    """Reference per-wallet loop the vectorized holder signal replaced."""
+    total_stake = sum(w.current_stake_usd for w in wallet_scores)
+    if total_stake == 0:
+        return 0.0, total_stake
+    signal = sum(
+        w.insider_likelihood_score
+        * min(w.current_stake_usd / total_stake, cfg.caps.max_influence_single_wallet)
+        * (1 if w.current_side == "YES" else -1)
+        for w in wallet_scores
+    )
+    return clip(signal, -1.0, 1.0), total_stake
+
+
+@pytest.mark.parametrize("use_kernel", KERNEL_PATHS)
+def test_market_signal_matches_scalar_path(monkeypatch, use_kernel):
+    monkeypatch.setattr(scoring, "HAS_NUMBA", use_kernel)
+    cfg = Config.default()
+
+    for seed in range(20):
+        scores = compute_wallet_scores(_wallets_data(random.Random(seed).randint(1, 60), seed), cfg)
+        holder_signal, total_stake = _scalar_holder_signal(scores, cfg)
+
+        signal = compute_market_signal(scores, None, cfg)
+
+        assert signal.holder_signal == pytest.approx(holder_signal, rel=1e-12, abs=1e-15)
+        assert signal.total_stake_usd == pytest.approx(total_stake, rel=1e-12)
+        assert signal.top_wallets_count == len(scores)
+
+
+def test_market_signal_zero_stake_is_flat():
+    cfg = Config.default()
+    scores = [
+        s.model_copy(update={"current_stake_usd": 0.0})
+        for s in compute_wallet_scores(_wallets_data(5), cfg)
+    ]
+
+    signal = compute_market_signal(scores, None, cfg)
+
+    assert signal.holder_signal == 0.0
+    assert signal.direction == "FLAT"
@@ -0,0 +1,90 @@
+"""Tests for the subgraph holder fallback."""
+
+from datetime import datetime, timezone
+
+from edge_scan.fetchers import subgraph
+from edge_scan.fetchers.subgraph import get_all_holders_subgraph, get_top_holders_subgraph
+from edge_scan.models import Market
+
+
+def _market() -> Market:
+    return Market(
+        condition_id="0xcond",
+        title="Will X beat earnings?",
+        end_time=datetime(2025, 10, 24, tzinfo=timezone.utc),
+        yes_token_id="111",
+        no_token_id="222",
+    )
+
+
+def test_holder_amounts_are_shares(monkeypatch):
+    positions = [
+        {"id": "a", "user": "0xa", "tokenId": "111", "amount": "2500000", "avgPrice": "400000"},
+        {"id": "b", "user": "0xb", "tokenId": "222", "amount": "1000000", "avgPrice": "900000"},
+    ]
+    monkeypatch.setattr(
+        subgraph, "http_post_json", lambda url, payload: {"data": {"userPositions": positions}}
+    )
+
+    holders = get_all_holders_subgraph(_market())
+
+    assert [(h.address, h.outcome_index, h.amount_usd) for h in holders] == [
+        ("0xa", 1, 2.5),
+        ("0xb", 0, 1.0),
+    ]
+
+
+def _top_positions_endpoint(n_per_token: int, queries: list):
+    """Stand-in for http_post_json over a subgraph ordering positions by amount."""
+
+    def post(url, payload):
+        variables = payload["variables"]
+        queries.append(variables)
+        token = variables["tokenId"]
+        start = variables["skip"]
+        stop = min(start + variables["first"], n_per_token)
+        positions = [
+            {
+                "id": f"{token}-{i}",
+                "user": f"0x{i:x}",
+                "tokenId": token,
+                "amount": str((n_per_token - i) * 10**6),
+            }
+            for i in range(start, stop)
+        ]
+        return {"data": {"userPositions": positions}}
+
+    return post
+
+
+def test_top_holders_one_query_per_outcome(monkeypatch):
+    queries = []
+    monkeypatch.setattr(subgraph, "http_post_json", _top_positions_endpoint(5000, queries))
+
+    holders = get_top_holders_subgraph(_market(), limit=500)
+
+    assert len(holders) == 1000
+    assert [(q["tokenId"], q["first"], q["skip"]) for q in queries] == [
+        ("222", 500, 0),
+        ("111", 500, 0),
+    ]
+    assert holders[0].amount_usd == 5000.0
+
+
+def test_top_holders_pages_past_page_size(monkeypatch):
+    queries = []
+    monkeypatch.setattr(subgraph, "http_post_json", _top_positions_endpoint(1500, queries))
+
+    holders = get_top_holders_subgraph(_market(), limit=2500, page_size=1000)
+
+    assert len(holders) == 3000
+    assert [(q["first"], q["skip"]) for q in queries] == [(1000, 0), (1000, 1000)] * 2
+
+
+def test_top_holders_failed_query_returns_empty(monkeypatch):
+    def fail(url, payload):
+        raise RuntimeError("down")
+
+    monkeypatch.setattr(subgraph, "http_post_json", fail)
+
+    assert get_top_holders_subgraph(_market(), limit=500) == []
@@ -0,0 +1,116 @@
+"""Tests for the AIMD request throttler."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from edge_scan.throttle import Throttler
+
+
+def _response(status: int = 200, **headers: str) -> httpx.Response:
+    return httpx.Response(status, headers=headers)
+
+
+def test_additive_increase_per_window():
+    throttler = Throttler(initial=4, c_max=64)
+
+    # One full window of `limit` successes adds roughly alpha
+    for _ in range(4):
+        throttler.record(_response())
+
+    assert throttler.concurrency == 4
+    assert 4.9 < throttler.limit < 5.0
+
+    throttler.record(_response())
+    assert throttler.concurrency == 5
+
+
+def test_increase_is_capped_at_c_max():
+    throttler = Throttler(initial=8, c_max=8)
+
+    for _ in range(100):
+        throttler.record(_response())
+
+    assert throttler.limit == 8.0
+
+
+@pytest.mark.parametrize("status", [429, 500, 503])
+def test_multiplicative_decrease_on_congestion(status):
+    throttler = Throttler(initial=32, c_max=64)
+
+    throttler.record(_response(status))
+
+    assert throttler.concurrency == 16
+
+
+def test_decrease_when_rate_budget_is_low():
+    throttler = Throttler(initial=32, c_max=64)
+
+    throttler.record(_response(**{"x-ratelimit-remaining": "5", "x-ratelimit-limit": "100"}))
+    assert throttler.concurrency == 16
+
+    throttler.record(_response(**{"x-ratelimit-remaining": "50", "x-ratelimit-limit": "100"}))
+    assert throttler.concurrency == 16
+
+
+def test_decrease_is_floored_at_c_min():
+    throttler = Throttler(initial=8, c_min=3, c_max=64)
+
+    for _ in range(10):
+        throttler.record(_response(429))
+
+    assert throttler.limit == 3.0
+
+
+def test_client_errors_do_not_back_off():
+    throttler = Throttler(initial=8, c_max=64)
+
+    throttler.record(_response(404))
+
+    assert throttler.limit > 8.0
+
+
+def test_in_flight_requests_bounded_by_concurrency():
+    async def run() -> int:
+        throttler = Throttler(initial=3, c_min=3, c_max=3)
+        in_flight = peak = 0
+
+        async def request() -> None:
+            nonlocal in_flight, peak
+            async with throttler:
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.001)
+                in_flight -= 1
+
+        await asyncio.gather(*(request() for _ in range(20)))
+        return peak
+
+    assert asyncio.run(run()) == 3
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"c_max": 0},
+        {"c_max": -4},
+        {"c_min": 0, "c_max": 8},
+        {"c_min": 4, "c_max": 2},
+        {"initial": 0},
+    ],
+)
+def test_invalid_bounds_rejected(kwargs):
+    with pytest.raises(ValueError):
+        Throttler(**kwargs)
+
+
+def test_retry_after_pause_is_capped():
+    async def run() -> float:
+        throttler = Throttler(max_pause=5.0)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        throttler.record(_response(429, **{"retry-after": "3600"}))
+        return throttler._resume_at - start
+
+    assert 5.0 <= asyncio.run(run()) < 6.0
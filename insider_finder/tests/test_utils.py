@@ -0,0 +1,146 @@
+"""Tests for timestamp parsing and the vectorized numeric helpers in utils."""
+
+import random
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+
+from edge_scan.utils import (
+    datetime_to_ns,
+    ns_to_datetime,
+    parse_datetime,
+    parse_timestamp_ns,
+    robust_scale,
+    shrink_to_prior,
+    shrink_to_prior_array,
+    weighted_mean,
+    winsorize,
+)
+
+NS = 1_000_000_000
+
+
+class TestParseTimestampNs:
+    def test_integer_seconds(self):
+        assert parse_timestamp_ns(1_700_000_000) == 1_700_000_000 * NS
+
+    def test_fractional_seconds_round_to_microseconds(self):
+        assert parse_timestamp_ns(1_700_000_000.25) == 1_700_000_000 * NS + 250_000_000
+        assert parse_timestamp_ns(-1.5) == -1_500_000_000
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "2024-05-01T12:30:45Z",
+            "2024-05-01T12:30:45.123456+00:00",
+            "2024-05-01T14:30:45+02:00",
+            "2024-05-01 12:30:45",
+            "2024-05-01",
+        ],
+    )
+    def test_iso_strings_match_parse_datetime(self, value):
+        assert parse_timestamp_ns(value) == datetime_to_ns(parse_datetime(value))
+
+    def test_iso_string_value(self):
+        expected = datetime(2024, 5, 1, 12, 30, 45, tzinfo=timezone.utc)
+        assert ns_to_datetime(parse_timestamp_ns("2024-05-01T12:30:45Z")) == expected
+
+    def test_numeric_matches_fromtimestamp(self):
+        rng = random.Random(5)
+        values = [rng.uniform(0, 2e9) for _ in range(2000)] + [rng.randrange(0, 2**31) for _ in range(200)]
+
+        for value in values:
+            expected = datetime.fromtimestamp(value, tz=timezone.utc)
+            assert ns_to_datetime(parse_timestamp_ns(value)) == expected
+            assert parse_timestamp_ns(value) == datetime_to_ns(parse_datetime(value))
+
+    def test_millisecond_timestamps_rejected_like_parse_datetime(self):
+        # Milliseconds are not auto-detected: as seconds they are out of datetime's range
+        with pytest.raises(ValueError):
+            parse_datetime(1_700_000_000_000)
+        with pytest.raises(ValueError):
+            parse_timestamp_ns(1_700_000_000_000)
+        with pytest.raises(ValueError):
+            parse_timestamp_ns(1_700_000_000_000.0)
+
+    def test_invalid_string_rejected(self):
+        with pytest.raises(ValueError):
+            parse_timestamp_ns("not a date")
+
+
+def test_ns_datetime_round_trip():
+    dt = datetime(2024, 5, 1, 12, 30, 45, 123456, tzinfo=timezone.utc)
+
+    assert ns_to_datetime(datetime_to_ns(dt)) == dt
+    assert datetime_to_ns(datetime(1970, 1, 1, tzinfo=timezone.utc)) == 0
+
+
+def _winsor_bounds(values, clip_pct):
+    """Scalar reference: the sorted-list order statistics used before vectorizing."""
+    sorted_vals = sorted(values)
+    n = len(sorted_vals)
+    lower_idx = int(n * (1 - clip_pct) / 2)
+    upper_idx = int(n * (1 + clip_pct) / 2)
+    lower = sorted_vals[lower_idx] if lower_idx < n else sorted_vals[0]
+    upper = sorted_vals[upper_idx] if upper_idx < n else sorted_vals[-1]
+    return lower, upper
+
+
+def _random_lists(seed=3, count=300):
+    rng = random.Random(seed)
+    for _ in range(count):
+        n = rng.randint(1, 50)
+        values = [rng.choice([rng.gauss(0, 5), float(rng.randint(-3, 3))]) for _ in range(n)]
+        yield values, rng.choice([0.0, 0.5, 0.9, 0.95, 1.0])
+
+
+def test_winsorize_matches_scalar_reference():
+    for values, clip_pct in _random_lists():
+        lower, upper = _winsor_bounds(values, clip_pct)
+        assert winsorize(values, clip_pct) == [max(lower, min(upper, v)) for v in values]
+
+
+def test_robust_scale_matches_scalar_reference():
+    for values, clip_pct in _random_lists():
+        lower, upper = _winsor_bounds(values, clip_pct)
+        if upper == lower:
+            expected = [0.5] * len(values)
+        else:
+            expected = [
+                max(0.0, min(1.0, (v - lower) / (upper - lower))) for v in values
+            ]
+        assert robust_scale(values, clip_pct) == expected
+
+
+def test_empty_inputs():
+    assert winsorize([]) == []
+    assert robust_scale([]) == []
+    assert weighted_mean([], []) == 0.0
+
+
+def test_weighted_mean():
+    rng = random.Random(9)
+    values = [rng.uniform(-10, 10) for _ in range(500)]
+    weights = [rng.uniform(0, 5) for _ in range(500)]
+
+    expected = sum(v * w for v, w in zip(values, weights)) / sum(weights)
+    assert weighted_mean(values, weights) == pytest.approx(expected, rel=1e-12)
+
+    with pytest.raises(ValueError):
+        weighted_mean([1.0, 2.0], [1.0])
+    with pytest.raises(ValueError):
+        weighted_mean([1.0], [0.0])
+
+
+def test_shrink_to_prior_array_matches_scalar():
+    rng = random.Random(2)
+    rows = [
+        (rng.random(), rng.random(), rng.randint(0, 30), rng.choice([0, 5, 10]))
+        for _ in range(1000)
+    ]
+    observed, prior, n_obs, n_prior = (np.array(col) for col in zip(*rows))
+
+    assert shrink_to_prior_array(observed, prior, n_obs, n_prior).tolist() == [
+        shrink_to_prior(*row) for row in rows
+    ]
@@ -3,12 +3,14 @@ Polymarket (Gamma) helper:
 - Find the 'Beat earnings' market by ticker/company (public-search)
 - Get market details (slug → clobTokenIds, end date)
 - Extract 'resolved side' + 'resolution text/source' when available
+- Batch many tickers concurrently with fetch_many / fetch_batch (async, one shared client)
 
 Inputs:
   query         : "NFLX" or "Netflix"
   close_dt_et   : "YYYY-MM-DD 16:00" (America/New_York)  # only used if you later add price snapshots
 
-Outputs (example keys):
+Outputs: a GammaLabel (slotted dataclass); .as_dict() gives the keys below,
+and labels_to_columns() turns a batch into column lists for a DataFrame.
 {
   "pm_market_id": "...",
   "pm_market_slug": "...",
@@ -22,40 +24,162 @@ Outputs (example keys):
 }
 """
 
-import requests
+import asyncio
+import atexit
+import json
+import math
+import os
+import re
+import threading
+import time
+import warnings
+from collections import OrderedDict
+from dataclasses import dataclass, fields
 from datetime import datetime, timezone, timedelta
 import zoneinfo
 
+import httpx
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 GAMMA_BASE = "https://gamma-api.polymarket.com"
 CLOB_BASE  = "https://clob.polymarket.com"  # kept for future price snapshots
+_ET = zoneinfo.ZoneInfo("America/New_York")
+
+# Title mentions "earnings" and "beat" or "miss", in either order
+_EARNINGS_TITLE_RE = re.compile(r"^(?=.*earnings)(?=.*(?:beat|miss))", re.IGNORECASE | re.DOTALL)
+
+_CLOSE_DT_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2}) (\d{2}):(\d{2})", re.ASCII)
+
+# One pooled client for the whole process so repeated lookups reuse the TCP/TLS connection
+_CLIENT = httpx.Client(
+    timeout=30.0,
+    limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+    http2=True,
+)
+atexit.register(_CLIENT.close)
+
+class _TTLCache:
+    """Small thread-safe LRU cache whose entries expire ttl seconds after insertion.
+
+    Values are stored and returned as-is, so callers cache immutable values
+    (raw response bytes) and decode a fresh copy on every hit.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
 
-def _ensure_dt_et(s, tz="America/New_York"):
+    def set(self, key, value) -> None:
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+def _env_ttl(name: str, default: float) -> float:
+    # A malformed override falls back to the default instead of failing at import
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    try:
+        ttl = float(raw)
+    except ValueError:
+        ttl = math.nan
+    if math.isnan(ttl):
+        warnings.warn(f"Ignoring invalid {name}={raw!r}; using {default:g} seconds", stacklevel=2)
+        return default
+    return ttl
+
+# Identical search/slug lookups within a run are served from memory (TTL in seconds; 0 disables).
+# Raw response bytes are cached, so a caller mutating its decoded dict cannot affect later hits.
+_SEARCH_CACHE = _TTLCache(maxsize=1024, ttl=_env_ttl("GAMMA_SEARCH_TTL", 300.0))
+_SLUG_CACHE = _TTLCache(maxsize=4096, ttl=_env_ttl("GAMMA_SLUG_TTL", 600.0))
+
+def _decode_json(content: bytes):
+    # orjson parses large search payloads several times faster than stdlib json
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+def _ensure_dt_et(s, tz=None):
     if isinstance(s, datetime):
         return s
-    return datetime.strptime(s, "%Y-%m-%d %H:%M").replace(tzinfo=zoneinfo.ZoneInfo(tz))
+    tzinfo = _ET if tz is None else zoneinfo.ZoneInfo(tz)
+    # Fast path for the canonical "YYYY-MM-DD HH:MM" shape; strptime handles the rest
+    m = _CLOSE_DT_RE.fullmatch(s)
+    if m:
+        return datetime(*map(int, m.groups()), tzinfo=tzinfo)
+    return datetime.strptime(s, "%Y-%m-%d %H:%M").replace(tzinfo=tzinfo)
 
 def gamma_search(query: str) -> dict:
-    r = requests.get(f"{GAMMA_BASE}/public-search", params={"q": query}, timeout=20)
+    cached = _SEARCH_CACHE.get(query)
+    if cached is not None:
+        return _decode_json(cached)
+    r = _CLIENT.get(f"{GAMMA_BASE}/public-search", params={"q": query}, timeout=20)
+    r.raise_for_status()
+    data = _decode_json(r.content)
+    _SEARCH_CACHE.set(query, r.content)
+    return data
+
+async def gamma_search_async(query: str, client: httpx.AsyncClient) -> dict:
+    cached = _SEARCH_CACHE.get(query)
+    if cached is not None:
+        return _decode_json(cached)
+    r = await client.get(f"{GAMMA_BASE}/public-search", params={"q": query}, timeout=20)
     r.raise_for_status()
-    return r.json()
+    data = _decode_json(r.content)
+    _SEARCH_CACHE.set(query, r.content)
+    return data
 
 def pick_earnings_market(search_json: dict, query_hint: str | None = None) -> dict:
     # Heuristic: choose first market whose title mentions earnings + (beat or miss)
     markets = search_json.get("markets", [])
-    cands = []
+    hint = query_hint.lower() if query_hint else None
     for m in markets:
-        title = (m.get("title") or "").lower()
-        if "earnings" in title and ("beat" in title or "miss" in title):
-            if not query_hint or query_hint.lower() in title:
-                cands.append(m)
-    if not cands:
-        raise ValueError("No Polymarket earnings Beat/Miss market found in public-search.")
-    return cands[0]  # You can refine selection if multiple matches
+        title = m.get("title") or ""
+        if _EARNINGS_TITLE_RE.search(title) and (not hint or hint in title.lower()):
+            return m  # You can refine selection if multiple matches
+    raise ValueError("No Polymarket earnings Beat/Miss market found in public-search.")
 
 def gamma_market_by_slug(slug: str) -> dict:
-    r = requests.get(f"{GAMMA_BASE}/markets/slug/{slug}", timeout=20)
+    cached = _SLUG_CACHE.get(slug)
+    if cached is not None:
+        return _decode_json(cached)
+    r = _CLIENT.get(f"{GAMMA_BASE}/markets/slug/{slug}", timeout=20)
+    r.raise_for_status()
+    data = _decode_json(r.content)
+    _SLUG_CACHE.set(slug, r.content)
+    return data
+
+async def gamma_market_by_slug_async(slug: str, client: httpx.AsyncClient) -> dict:
+    cached = _SLUG_CACHE.get(slug)
+    if cached is not None:
+        return _decode_json(cached)
+    r = await client.get(f"{GAMMA_BASE}/markets/slug/{slug}", timeout=20)
     r.raise_for_status()
-    return r.json()
+    data = _decode_json(r.content)
+    _SLUG_CACHE.set(slug, r.content)
+    return data
 
 def _extract_yes_token(details: dict) -> str | None:
     # Conventionally clobTokenIds = [YES, NO]; keep robust fallback
@@ -75,20 +199,16 @@ def _extract_resolution_fields(details: dict) -> dict:
     if side is False: side = "NO"
 
     # Resolution text + source/url live under market or event; try a few places.
-    res_text = (
-        details.get("resolutionText")
-        or (details.get("resolution") or {}).get("text")
-        or (details.get("event") or {}).get("resolutionText")
-    )
+    res = details.get("resolution") or {}
+    ev = details.get("event") or {}
+    res_text = details.get("resolutionText") or res.get("text") or ev.get("resolutionText")
     res_source = (
-        details.get("resolutionSource")
-        or (details.get("resolution") or {}).get("source")
-        or (details.get("event") or {}).get("resolutionSource")
+        details.get("resolutionSource") or res.get("source") or ev.get("resolutionSource")
     )
     res_url = (
         details.get("resolutionSourceUrl")
-        or (details.get("resolution") or {}).get("sourceUrl")
-        or (details.get("event") or {}).get("resolutionSourceUrl")
+        or res.get("sourceUrl")
+        or ev.get("resolutionSourceUrl")
         or res_source  # sometimes the source itself is a URL
     )
 
@@ -99,15 +219,34 @@ def _extract_resolution_fields(details: dict) -> dict:
         "resolution_source_url": res_url,
     }
 
-def fetch_gamma_labels_for_ticker(query: str, close_dt_et: str | datetime) -> dict:
-    # 1) Search
-    s = gamma_search(query)
-    pick = pick_earnings_market(s, query_hint=query)
-    slug = pick.get("slug") or pick.get("id")
-    title = pick.get("title", "")
+def _pick_slug(search_json: dict, query: str) -> tuple[str, str]:
+    pick = pick_earnings_market(search_json, query_hint=query)
+    return pick.get("slug") or pick.get("id"), pick.get("title", "")
 
-    # 2) Details (slug → id, endDate, tokens, resolution fields)
-    d = gamma_market_by_slug(slug)
+@dataclass(slots=True)
+class GammaLabel:
+    pm_market_id: str | None
+    pm_market_slug: str
+    pm_market_title: str
+    earnings_datetime_utc: str | None  # may be None if Gamma doesn't expose it here
+    clob_yes_token_id: str | None
+    close_dt_utc_for_snapshots: str
+    resolved: bool
+    resolved_side: str | None
+    resolution_text: str | None
+    resolution_source_url: str | None
+
+    def as_dict(self) -> dict:
+        # Same keys (and order) as the dicts this module used to return
+        return {name: getattr(self, name) for name in _LABEL_FIELDS}
+
+_LABEL_FIELDS = tuple(f.name for f in fields(GammaLabel))
+
+def labels_to_columns(labels: list[GammaLabel]) -> dict[str, list]:
+    # Column-oriented view of a batch, e.g. for pandas.DataFrame(labels_to_columns(labels))
+    return {name: [getattr(label, name) for label in labels] for name in _LABEL_FIELDS}
+
+def _build_labels(d: dict, slug: str, title: str, close_dt_et: str | datetime) -> GammaLabel:
     pm_market_id = d.get("id")
     pm_market_slug = d.get("slug") or slug
     pm_market_title = d.get("title", title)
@@ -126,15 +265,58 @@ def fetch_gamma_labels_for_ticker(query: str, close_dt_et: str | datetime) -> di
     close_dt = _ensure_dt_et(close_dt_et)
     close_dt_utc = close_dt.astimezone(timezone.utc).isoformat()
 
-    return {
-        "pm_market_id": pm_market_id,
-        "pm_market_slug": pm_market_slug,
-        "pm_market_title": pm_market_title,
-        "earnings_datetime_utc": earnings_dt_utc,  # may be None if Gamma doesn't expose it here
-        "clob_yes_token_id": yes_token,
-        "close_dt_utc_for_snapshots": close_dt_utc,
+    return GammaLabel(
+        pm_market_id=pm_market_id,
+        pm_market_slug=pm_market_slug,
+        pm_market_title=pm_market_title,
+        earnings_datetime_utc=earnings_dt_utc,
+        clob_yes_token_id=yes_token,
+        close_dt_utc_for_snapshots=close_dt_utc,
         **resolution,  # resolved, resolved_side, resolution_text, resolution_source_url
-    }
+    )
+
+def fetch_gamma_labels_for_ticker(query: str, close_dt_et: str | datetime) -> GammaLabel:
+    # 1) Search
+    slug, title = _pick_slug(gamma_search(query), query)
+
+    # 2) Details (slug → id, endDate, tokens, resolution fields)
+    d = gamma_market_by_slug(slug)
+    return _build_labels(d, slug, title, close_dt_et)
+
+async def fetch_gamma_labels_for_ticker_async(
+    query: str, close_dt_et: str | datetime, client: httpx.AsyncClient
+) -> GammaLabel:
+    # Search → details is inherently sequential per ticker; concurrency comes from fetch_many
+    slug, title = _pick_slug(await gamma_search_async(query, client), query)
+    d = await gamma_market_by_slug_async(slug, client)
+    return _build_labels(d, slug, title, close_dt_et)
+
+def _batch_client() -> httpx.AsyncClient:
+    # One HTTP/2 client for the batch so all tickers share a connection to Gamma
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=30.0,
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+    )
+
+async def fetch_many(queries: list[str], close_dt_et: str | datetime) -> list[GammaLabel]:
+    async with _batch_client() as client:
+        return await asyncio.gather(
+            *[fetch_gamma_labels_for_ticker_async(q, close_dt_et, client) for q in queries]
+        )
+
+async def fetch_batch(
+    queries: list[str], close_dt_et: str | datetime, max_concurrency: int = 8
+) -> list[GammaLabel | BaseException]:
+    # Like fetch_many, but at most max_concurrency tickers in flight (gentler on Gamma rate
+    # limits), and a failing ticker yields its exception in place instead of failing the batch
+    sem = asyncio.Semaphore(max_concurrency)
+    async with _batch_client() as client:
+        async def one(q: str) -> GammaLabel:
+            async with sem:
+                return await fetch_gamma_labels_for_ticker_async(q, close_dt_et, client)
+
+        return await asyncio.gather(*map(one, queries), return_exceptions=True)
 
 # ---------------- Example ----------------
 if __name__ == "__main__":
@@ -143,5 +325,5 @@ if __name__ == "__main__":
         query="Netflix",           # try "NFLX" too if needed
         close_dt_et="2025-10-21 16:00",
     )
-    print(out)
+    print(out.as_dict())
     # Append 'out' to your Google Sheet row for this ticker/date alongside your price fields.